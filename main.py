@@ -19,7 +19,7 @@ from src.entities.player import Player
 from src.entities.enemies import DementorEnemy, HollowWarrior, ShadowArcher, ShieldGuardian, Berserker, FireBat
 from src.entities.enemies.shadow_knight_boss import ShadowKnight
 from src.entities.enemies.arcane_sorcerer_boss import ArcaneSorcerer
-from src.world import Platform, Camera, ParallaxLayer, Coin, DecorativeElement, Particle
+from src.world import Platform, Camera, ParallaxLayer, Coin, DecorativeElement, Particle, ParticleGroup
 from src.systems import PlayerStats
 from src.systems.combat_system import ScreenShake, HitFreeze
 
@@ -121,7 +121,7 @@ class Game:
         self.coins = pygame.sprite.Group()
         self.decorations = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
-        self.particles = pygame.sprite.Group()
+        self.particles = ParticleGroup()
         self.projectiles = pygame.sprite.Group()
         
         # Game state
@@ -522,8 +522,8 @@ class Game:
         for proj in projectile_hits:
             self.player.take_damage(proj.damage)
         
-        # Update particles
-        self.particles.update()
+        # Update particles (off-screen ones skip their redraw)
+        self.particles.update(self.camera.camera.inflate(200, 200))
         
         # Update decorations
         self.decorations.update()
@@ -549,19 +549,14 @@ class Game:
                 max(0, SKY_BLUE[1] - color_shift),
                 max(0, SKY_BLUE[2] - color_shift)
             )
-            pygame.draw.rect(self.screen, bg_color, (0, int(offset_y), SCREEN_WIDTH, 200))
+            self.screen.fill(bg_color, (0, int(offset_y), SCREEN_WIDTH, 200))
         
-        # Draw decorations
-        for decoration in self.decorations:
-            self.screen.blit(decoration.image, self.camera.apply(decoration))
-        
-        # Draw platforms
-        for platform in self.platforms:
-            self.screen.blit(platform.image, self.camera.apply(platform))
-        
-        # Draw coins
-        for coin in self.coins:
-            self.screen.blit(coin.image, self.camera.apply(coin))
+        # Draw decorations, platforms and coins (one blits call per layer)
+        apply_xy = self.camera.apply_xy
+        self.screen.blits([(decoration.image, apply_xy(decoration)) for decoration in self.decorations],
+                          doreturn=False)
+        Platform.draw_visible(self.screen, self.platforms, self.camera)
+        self.screen.blits([(coin.image, apply_xy(coin)) for coin in self.coins], doreturn=False)
         
         # Draw enemies
         for enemy in self.enemies:
@@ -573,20 +568,14 @@ class Game:
         
         # Draw projectiles
         for proj in self.projectiles:
-            self.screen.blit(proj.image, self.camera.apply(proj))
+            self.screen.blit(proj.image, self.camera.apply_xy(proj))
         
         # Draw player (with camera for combat particles)
         player_screen_pos = self.camera.apply(self.player)
         self.player.draw(self.screen, player_screen_pos, self.camera)
         
         # Draw particles
-        for particle in self.particles:
-            particle_pos = self.camera.apply_pos(particle.rect.x, particle.rect.y)
-            temp_rect = particle.rect.copy()
-            particle.rect.x = particle_pos[0]
-            particle.rect.y = particle_pos[1]
-            self.screen.blit(particle.image, particle.rect)
-            particle.rect = temp_rect
+        Particle.draw_batch(self.screen, self.particles, self.camera.x, self.camera.y)
         
         # Draw spatial partition debug (F3 to toggle)
         if self.spatial_debug:
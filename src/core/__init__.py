@@ -26,6 +26,7 @@ from src.core.game_states import (
 
 from src.core.resources import (
     ResourceManager,
+    SurfaceCache,
     get_resource_manager,
     load_image,
     load_sound,
@@ -48,7 +49,7 @@ __all__ = [
     'GameState', 'GameStateType', 'GameStateManager',
     'MenuState', 'PlayingState', 'PausedState', 'GameOverState',
     # Resources
-    'ResourceManager', 'get_resource_manager',
+    'ResourceManager', 'SurfaceCache', 'get_resource_manager',
     'load_image', 'load_sound', 'load_font', 'play_music', 'stop_music',
     # Config
     'Config', 'KeybindingManager', 'get_config'
@@ -6,7 +6,7 @@ Prevents duplicate loading and manages memory efficiently
 
 import pygame
 import os
-from typing import Dict, Optional
+from typing import Callable, Dict, Hashable, Optional
 from pathlib import Path
 
 
@@ -322,6 +322,64 @@ class ResourceManager:
         }
 
 
+class SurfaceCache:
+    """
+    Bounded cache for generated Surfaces (rendered text, pre-drawn stamps)
+    Evicts the oldest entry once full
+    """
+    
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize surface cache
+        
+        Args:
+            max_size: Maximum number of cached surfaces
+        """
+        self._surfaces: Dict[Hashable, pygame.Surface] = {}
+        self.max_size = max_size
+    
+    def get(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Get a cached surface, building it on first use
+        
+        Args:
+            key: Cache key identifying the surface
+            build: Called with no arguments to create the surface on a miss
+        
+        Returns:
+            Cached surface (shared - do not modify)
+        """
+        surface = self._surfaces.get(key)
+        if surface is None:
+            if len(self._surfaces) >= self.max_size:
+                # Evict the oldest entry
+                del self._surfaces[next(iter(self._surfaces))]
+            surface = build()
+            self._surfaces[key] = surface
+        return surface
+    
+    def render(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface from a previous identical render
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+        
+        Returns:
+            Rendered text surface (shared - do not modify)
+        """
+        return self.get((font, text, color), lambda: font.render(text, True, color))
+    
+    def clear(self):
+        """Drop every cached surface"""
+        self._surfaces.clear()
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+
 # Global resource manager instance
 _global_resource_manager = None
 
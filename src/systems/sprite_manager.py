@@ -1,6 +1,16 @@
 """
 Sprite Manager - Handles sprite loading and procedural generation
 Generates fantasy-style character sprites when image files are not available
+
+Performance notes:
+Generation cost is dominated by Python allocation and pygame draw-call
+overhead, not arithmetic - there are only a handful of math.sin/cos calls
+per sprite. When optimizing, work in this order:
+  1. Avoid generating at all (sprite_cache, pre-baking)
+  2. Avoid per-call allocations (Rects, tuples, temporary Surfaces)
+  3. Batch or merge draw calls
+  4. Only then look at the math
+Each generator is tagged with a "# perf:" comment naming its dominant cost.
 """
 
 import pygame
@@ -10,9 +20,24 @@ import os
 class SpriteManager:
     """Manages sprite assets and generates placeholder sprites"""
     
+    # Placeholder for unknown entity types, identical for every state/frame
+    _DEFAULT_SPRITE = None
+    # Archer quiver + fletching, stamped onto every archer frame
+    _QUIVER_STAMP = None
+    
     def __init__(self):
         self.sprite_cache = {}
         self.assets_dir = "assets/sprites"
+        # Reusable Rects for the generators - pygame.draw takes them by
+        # reference, so mutating these avoids a tuple/Rect per primitive.
+        # Slot 0 is for one-shot draws, slot 1 for named rects reused later.
+        self._scratch_rects = [pygame.Rect(0, 0, 0, 0) for _ in range(4)]
+        
+    def _rect(self, x, y, w, h, slot=0):
+        """Return a pooled scratch Rect set to (x, y, w, h)"""
+        rect = self._scratch_rects[slot]
+        rect.update(x, y, w, h)
+        return rect
         
     def get_sprite(self, entity_type, state="idle", frame=0):
         """Get sprite for entity, generate if not found"""
@@ -50,6 +75,7 @@ class SpriteManager:
     
     def _generate_player_sprite(self, state, frame):
         """Generate knight/warrior player sprite with attack animations"""
+        # perf: draw-bound (~25 primitives); attack states delegate below
         size = (64, 64)
         surface = pygame.Surface(size, pygame.SRCALPHA)
         
@@ -70,18 +96,18 @@ class SpriteManager:
         base_y = 48
         
         # Legs
-        pygame.draw.rect(surface, armor_dark, (center_x - 6, base_y - 15, 5, 12))
-        pygame.draw.rect(surface, armor_dark, (center_x + 1, base_y - 15, 5, 12))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x - 6, base_y - 15, 5, 12))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x + 1, base_y - 15, 5, 12))
         # Boots
-        pygame.draw.rect(surface, (30, 30, 30), (center_x - 7, base_y - 4, 6, 5))
-        pygame.draw.rect(surface, (30, 30, 30), (center_x + 1, base_y - 4, 6, 5))
+        pygame.draw.rect(surface, (30, 30, 30), self._rect(center_x - 7, base_y - 4, 6, 5))
+        pygame.draw.rect(surface, (30, 30, 30), self._rect(center_x + 1, base_y - 4, 6, 5))
         
         # Torso - armored
-        body_rect = pygame.Rect(center_x - 8, base_y - 30 + bob, 16, 18)
+        body_rect = self._rect(center_x - 8, base_y - 30 + bob, 16, 18, 1)
         pygame.draw.ellipse(surface, armor_light, body_rect)
         # Chest plate detail
-        pygame.draw.rect(surface, armor_dark, (center_x - 6, base_y - 28 + bob, 12, 2))
-        pygame.draw.rect(surface, armor_dark, (center_x - 6, base_y - 18 + bob, 12, 2))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x - 6, base_y - 28 + bob, 12, 2))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x - 6, base_y - 18 + bob, 12, 2))
         
         # Cape/cloak (behind)
         cape_points = [
@@ -95,19 +121,19 @@ class SpriteManager:
         
         # Arms
         # Left arm
-        pygame.draw.rect(surface, armor_light, (center_x - 12, base_y - 28 + bob, 4, 14))
+        pygame.draw.rect(surface, armor_light, self._rect(center_x - 12, base_y - 28 + bob, 4, 14))
         # Right arm
-        pygame.draw.rect(surface, armor_light, (center_x + 8, base_y - 28 + bob, 4, 14))
+        pygame.draw.rect(surface, armor_light, self._rect(center_x + 8, base_y - 28 + bob, 4, 14))
         
         # Shoulder pauldrons
         pygame.draw.circle(surface, armor_dark, (center_x - 10, base_y - 28 + bob), 5)
         pygame.draw.circle(surface, armor_dark, (center_x + 10, base_y - 28 + bob), 5)
         
         # Head - helmet
-        head_rect = pygame.Rect(center_x - 7, base_y - 42 + bob, 14, 14)
+        head_rect = self._rect(center_x - 7, base_y - 42 + bob, 14, 14, 1)
         pygame.draw.ellipse(surface, armor_light, head_rect)
         # Visor slit
-        pygame.draw.rect(surface, (20, 20, 20), (center_x - 4, base_y - 36 + bob, 8, 2))
+        pygame.draw.rect(surface, (20, 20, 20), self._rect(center_x - 4, base_y - 36 + bob, 8, 2))
         # Glowing eyes
         pygame.draw.circle(surface, accent, (center_x - 2, base_y - 36 + bob), 2)
         pygame.draw.circle(surface, accent, (center_x + 2, base_y - 36 + bob), 2)
@@ -126,6 +152,7 @@ class SpriteManager:
         Generate smooth attack animation frames
         Hollow Knight style - Knight slashing with weapon trail
         """
+        # perf: alloc-bound during active frames (per-step trail Surfaces)
         size = (96, 96)  # Larger canvas for weapon swing
         surface = pygame.Surface(size, pygame.SRCALPHA)
         
@@ -180,17 +207,17 @@ class SpriteManager:
         pygame.draw.polygon(surface, cloth, cape_points)
         
         # Legs (grounded, stable stance)
-        pygame.draw.rect(surface, armor_dark, (center_x - 6, base_y - 15, 5, 12))
-        pygame.draw.rect(surface, armor_dark, (center_x + 1, base_y - 15, 5, 12))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x - 6, base_y - 15, 5, 12))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x + 1, base_y - 15, 5, 12))
         # Boots
-        pygame.draw.rect(surface, (30, 30, 30), (center_x - 7, base_y - 4, 6, 5))
-        pygame.draw.rect(surface, (30, 30, 30), (center_x + 1, base_y - 4, 6, 5))
+        pygame.draw.rect(surface, (30, 30, 30), self._rect(center_x - 7, base_y - 4, 6, 5))
+        pygame.draw.rect(surface, (30, 30, 30), self._rect(center_x + 1, base_y - 4, 6, 5))
         
         # Torso - armored (leaning)
-        body_rect = pygame.Rect(center_x + lean - 8, base_y - 30, 16, 18)
+        body_rect = self._rect(center_x + lean - 8, base_y - 30, 16, 18, 1)
         pygame.draw.ellipse(surface, armor_light, body_rect)
-        pygame.draw.rect(surface, armor_dark, (center_x + lean - 6, base_y - 28, 12, 2))
-        pygame.draw.rect(surface, armor_dark, (center_x + lean - 6, base_y - 18, 12, 2))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x + lean - 6, base_y - 28, 12, 2))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x + lean - 6, base_y - 18, 12, 2))
         
         # Arms - attacking arm extended
         # Calculate arm position based on swing
@@ -207,15 +234,15 @@ class SpriteManager:
         pygame.draw.circle(surface, armor_dark, (center_x + lean + 10, base_y - 28), 5)
         
         # Other arm (static)
-        pygame.draw.rect(surface, armor_light, (center_x + lean - 12, base_y - 28, 4, 14))
+        pygame.draw.rect(surface, armor_light, self._rect(center_x + lean - 12, base_y - 28, 4, 14))
         pygame.draw.circle(surface, armor_dark, (center_x + lean - 10, base_y - 28), 5)
         
         # Head - helmet (turns slightly with swing)
         head_turn = int(lean * 0.5)
-        head_rect = pygame.Rect(center_x + lean + head_turn - 7, base_y - 42, 14, 14)
+        head_rect = self._rect(center_x + lean + head_turn - 7, base_y - 42, 14, 14, 1)
         pygame.draw.ellipse(surface, armor_light, head_rect)
         # Visor
-        pygame.draw.rect(surface, (20, 20, 20), (center_x + lean + head_turn - 4, base_y - 36, 8, 2))
+        pygame.draw.rect(surface, (20, 20, 20), self._rect(center_x + lean + head_turn - 4, base_y - 36, 8, 2))
         # Glowing eyes (brighter during active phase)
         eye_brightness = accent if progress < 0.5 else (255, 180, 100)
         pygame.draw.circle(surface, eye_brightness, (center_x + lean + head_turn - 2, base_y - 36), 2)
@@ -279,6 +306,7 @@ class SpriteManager:
     
     def _generate_shield_guardian_sprite(self, state, frame):
         """Generate heavily armored tank with large shield"""
+        # perf: draw-bound
         size = (80, 80)
         surface = pygame.Surface(size, pygame.SRCALPHA)
         
@@ -294,7 +322,7 @@ class SpriteManager:
         # Large shield (in front)
         shield_width = 24
         shield_height = 40
-        shield_rect = pygame.Rect(center_x - shield_width//2, base_y - 50, shield_width, shield_height)
+        shield_rect = self._rect(center_x - shield_width//2, base_y - 50, shield_width, shield_height, 1)
         pygame.draw.ellipse(surface, shield_color, shield_rect)
         # Shield boss (center)
         pygame.draw.circle(surface, shield_glow, (center_x, base_y - 30), 6)
@@ -304,18 +332,18 @@ class SpriteManager:
         
         # Body (behind shield, partially visible)
         # Legs
-        pygame.draw.rect(surface, armor_dark, (center_x - 8, base_y - 20, 6, 18))
-        pygame.draw.rect(surface, armor_dark, (center_x + 2, base_y - 20, 6, 18))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x - 8, base_y - 20, 6, 18))
+        pygame.draw.rect(surface, armor_dark, self._rect(center_x + 2, base_y - 20, 6, 18))
         
         # Torso (bulky)
-        body_rect = pygame.Rect(center_x - 12, base_y - 42, 24, 24)
+        body_rect = self._rect(center_x - 12, base_y - 42, 24, 24, 1)
         pygame.draw.ellipse(surface, armor_primary, body_rect)
         
         # Helmet (above shield)
-        helmet_rect = pygame.Rect(center_x - 10, base_y - 58, 20, 18)
+        helmet_rect = self._rect(center_x - 10, base_y - 58, 20, 18, 1)
         pygame.draw.ellipse(surface, armor_primary, helmet_rect)
         # Visor
-        pygame.draw.rect(surface, (30, 30, 40), (center_x - 6, base_y - 52, 12, 3))
+        pygame.draw.rect(surface, (30, 30, 40), self._rect(center_x - 6, base_y - 52, 12, 3))
         # Red glowing eyes
         pygame.draw.circle(surface, (255, 100, 100), (center_x - 3, base_y - 51), 2)
         pygame.draw.circle(surface, (255, 100, 100), (center_x + 3, base_y - 51), 2)
@@ -325,12 +353,13 @@ class SpriteManager:
         pygame.draw.circle(surface, armor_dark, (center_x + 16, base_y - 42), 8)
         
         # Weapon arm (holding shield)
-        pygame.draw.rect(surface, armor_primary, (center_x - 18, base_y - 40, 6, 16))
+        pygame.draw.rect(surface, armor_primary, self._rect(center_x - 18, base_y - 40, 6, 16))
         
         return surface
     
     def _generate_berserker_sprite(self, state, frame):
         """Generate wild berserker warrior"""
+        # perf: draw-bound; alloc-bound in rage (3 aura Surfaces)
         size = (64, 72)
         surface = pygame.Surface(size, pygame.SRCALPHA)
         
@@ -348,29 +377,29 @@ class SpriteManager:
         lean = -5 if state in ["attacking", "rage"] else 0
         
         # Legs (muscular)
-        pygame.draw.rect(surface, muscle, (center_x - 7, base_y - 18, 6, 16))
-        pygame.draw.rect(surface, muscle, (center_x + 1, base_y - 18, 6, 16))
+        pygame.draw.rect(surface, muscle, self._rect(center_x - 7, base_y - 18, 6, 16))
+        pygame.draw.rect(surface, muscle, self._rect(center_x + 1, base_y - 18, 6, 16))
         # Torn pants
-        pygame.draw.rect(surface, cloth, (center_x - 7, base_y - 18, 6, 10))
-        pygame.draw.rect(surface, cloth, (center_x + 1, base_y - 18, 6, 10))
+        pygame.draw.rect(surface, cloth, self._rect(center_x - 7, base_y - 18, 6, 10))
+        pygame.draw.rect(surface, cloth, self._rect(center_x + 1, base_y - 18, 6, 10))
         
         # Torso (bare-chested, muscular)
-        body_rect = pygame.Rect(center_x - 10 + lean, base_y - 40, 20, 24)
+        body_rect = self._rect(center_x - 10 + lean, base_y - 40, 20, 24, 1)
         pygame.draw.ellipse(surface, skin, body_rect)
         # Muscle definition
-        pygame.draw.arc(surface, muscle, (center_x - 8 + lean, base_y - 38, 7, 12), 0, 3.14, 2)
-        pygame.draw.arc(surface, muscle, (center_x + 1 + lean, base_y - 38, 7, 12), 0, 3.14, 2)
+        pygame.draw.arc(surface, muscle, self._rect(center_x - 8 + lean, base_y - 38, 7, 12), 0, 3.14, 2)
+        pygame.draw.arc(surface, muscle, self._rect(center_x + 1 + lean, base_y - 38, 7, 12), 0, 3.14, 2)
         
         # Arms (huge, muscular)
         # Left arm
-        pygame.draw.rect(surface, skin, (center_x - 16 + lean, base_y - 38, 7, 18))
+        pygame.draw.rect(surface, skin, self._rect(center_x - 16 + lean, base_y - 38, 7, 18))
         pygame.draw.circle(surface, muscle, (center_x - 12 + lean, base_y - 32), 5)
         # Right arm
-        pygame.draw.rect(surface, skin, (center_x + 9 + lean, base_y - 38, 7, 18))
+        pygame.draw.rect(surface, skin, self._rect(center_x + 9 + lean, base_y - 38, 7, 18))
         pygame.draw.circle(surface, muscle, (center_x + 12 + lean, base_y - 32), 5)
         
         # Head - wild, unkempt
-        head_rect = pygame.Rect(center_x - 8 + lean, base_y - 52, 16, 16)
+        head_rect = self._rect(center_x - 8 + lean, base_y - 52, 16, 16, 1)
         pygame.draw.ellipse(surface, skin, head_rect)
         # Wild hair
         for i in range(5):
@@ -403,7 +432,7 @@ class SpriteManager:
         weapon_x = center_x + 12 + lean
         weapon_y = base_y - 30
         # Handle
-        pygame.draw.rect(surface, (80, 50, 30), (weapon_x, weapon_y, 3, 20))
+        pygame.draw.rect(surface, (80, 50, 30), self._rect(weapon_x, weapon_y, 3, 20))
         # Axe head
         axe_points = [
             (weapon_x - 8, weapon_y + 5),
@@ -418,6 +447,7 @@ class SpriteManager:
     
     def _generate_fire_bat_sprite(self, state, frame):
         """Generate small fire bat sprite"""
+        # perf: draw-bound
         size = (48, 48)
         surface = pygame.Surface(size, pygame.SRCALPHA)
         
@@ -433,11 +463,11 @@ class SpriteManager:
         fire_yellow = (255, 200, 50)
         
         # Body
-        body_rect = pygame.Rect(center_x - 8, center_y - 6, 16, 12)
+        body_rect = self._rect(center_x - 8, center_y - 6, 16, 12, 1)
         pygame.draw.ellipse(surface, body_color, body_rect)
         # Fire glow around body
-        glow_rect = body_rect.inflate(4, 4)
-        pygame.draw.ellipse(surface, fire_orange, glow_rect, 2)
+        body_rect.inflate_ip(4, 4)
+        pygame.draw.ellipse(surface, fire_orange, body_rect, 2)
         
         # Wings (bat-like, on fire)
         # Left wing
@@ -490,6 +520,7 @@ class SpriteManager:
     
     def _generate_hollow_warrior_sprite(self, state, frame):
         """Generate hollow/undead warrior"""
+        # perf: draw-bound
         size = (56, 64)
         surface = pygame.Surface(size, pygame.SRCALPHA)
         
@@ -502,14 +533,14 @@ class SpriteManager:
         base_y = 56
         
         # Legs (skeletal)
-        pygame.draw.rect(surface, bone, (center_x - 5, base_y - 16, 3, 14))
-        pygame.draw.rect(surface, bone, (center_x + 2, base_y - 16, 3, 14))
+        pygame.draw.rect(surface, bone, self._rect(center_x - 5, base_y - 16, 3, 14))
+        pygame.draw.rect(surface, bone, self._rect(center_x + 2, base_y - 16, 3, 14))
         # Knee joints
         pygame.draw.circle(surface, bone, (center_x - 3, base_y - 8), 3)
         pygame.draw.circle(surface, bone, (center_x + 3, base_y - 8), 3)
         
         # Torso (armored ribcage)
-        body_rect = pygame.Rect(center_x - 8, base_y - 34, 16, 20)
+        body_rect = self._rect(center_x - 8, base_y - 34, 16, 20, 1)
         pygame.draw.ellipse(surface, armor, body_rect)
         # Ribs (visible through armor)
         for i in range(4):
@@ -518,14 +549,14 @@ class SpriteManager:
         
         # Arms (skeletal with armor)
         # Left arm
-        pygame.draw.rect(surface, bone, (center_x - 12, base_y - 32, 3, 16))
+        pygame.draw.rect(surface, bone, self._rect(center_x - 12, base_y - 32, 3, 16))
         pygame.draw.circle(surface, armor, (center_x - 10, base_y - 28), 4)
         # Right arm (sword arm)
-        pygame.draw.rect(surface, bone, (center_x + 9, base_y - 32, 3, 16))
+        pygame.draw.rect(surface, bone, self._rect(center_x + 9, base_y - 32, 3, 16))
         pygame.draw.circle(surface, armor, (center_x + 10, base_y - 28), 4)
         
         # Head (skull)
-        skull_rect = pygame.Rect(center_x - 7, base_y - 46, 14, 14)
+        skull_rect = self._rect(center_x - 7, base_y - 46, 14, 14, 1)
         pygame.draw.ellipse(surface, bone, skull_rect)
         # Eye sockets (glowing)
         pygame.draw.circle(surface, (30, 30, 30), (center_x - 3, base_y - 42), 3)
@@ -533,7 +564,7 @@ class SpriteManager:
         pygame.draw.circle(surface, glow, (center_x - 3, base_y - 42), 2)
         pygame.draw.circle(surface, glow, (center_x + 3, base_y - 42), 2)
         # Jaw
-        pygame.draw.rect(surface, bone, (center_x - 4, base_y - 36, 8, 4))
+        pygame.draw.rect(surface, bone, self._rect(center_x - 4, base_y - 36, 8, 4))
         
         # Helmet (broken)
         helmet_points = [
@@ -546,14 +577,15 @@ class SpriteManager:
         # Sword (rusty)
         sword_x = center_x + 12
         sword_y = base_y - 20
-        pygame.draw.rect(surface, (100, 80, 70), (sword_x, sword_y, 2, 16))  # Blade
-        pygame.draw.rect(surface, (80, 60, 50), (sword_x - 2, sword_y + 16, 6, 3))  # Guard
-        pygame.draw.rect(surface, (60, 50, 40), (sword_x, sword_y + 19, 2, 4))  # Handle
+        pygame.draw.rect(surface, (100, 80, 70), self._rect(sword_x, sword_y, 2, 16))  # Blade
+        pygame.draw.rect(surface, (80, 60, 50), self._rect(sword_x - 2, sword_y + 16, 6, 3))  # Guard
+        pygame.draw.rect(surface, (60, 50, 40), self._rect(sword_x, sword_y + 19, 2, 4))  # Handle
         
         return surface
     
     def _generate_dementor_sprite(self, state, frame):
         """Generate floating dementor/ghost sprite"""
+        # perf: draw-bound; alloc-bound when attacking (3 ring Surfaces)
         size = (56, 72)
         surface = pygame.Surface(size, pygame.SRCALPHA)
         
@@ -589,10 +621,10 @@ class SpriteManager:
                            (tatter_x + 2, base_y + 8), 2)
         
         # Hood (dark void face)
-        hood_rect = pygame.Rect(center_x - 10, base_y - 54, 20, 18)
+        hood_rect = self._rect(center_x - 10, base_y - 54, 20, 18, 1)
         pygame.draw.ellipse(surface, cloak_dark, hood_rect)
         # Face void (darker)
-        face_rect = pygame.Rect(center_x - 8, base_y - 50, 16, 14)
+        face_rect = self._rect(center_x - 8, base_y - 50, 16, 14, 1)
         pygame.draw.ellipse(surface, (10, 10, 20), face_rect)
         
         # Glowing eyes (soul energy)
@@ -603,13 +635,13 @@ class SpriteManager:
         
         # Skeletal hands
         # Left hand
-        pygame.draw.rect(surface, (180, 180, 170), (center_x - 16, base_y - 30, 3, 8))
+        pygame.draw.rect(surface, (180, 180, 170), self._rect(center_x - 16, base_y - 30, 3, 8))
         for finger in range(3):
             pygame.draw.line(surface, (180, 180, 170),
                            (center_x - 16 + finger, base_y - 22),
                            (center_x - 16 + finger, base_y - 18), 1)
         # Right hand
-        pygame.draw.rect(surface, (180, 180, 170), (center_x + 13, base_y - 30, 3, 8))
+        pygame.draw.rect(surface, (180, 180, 170), self._rect(center_x + 13, base_y - 30, 3, 8))
         for finger in range(3):
             pygame.draw.line(surface, (180, 180, 170),
                            (center_x + 13 + finger, base_y - 22),
@@ -628,6 +660,7 @@ class SpriteManager:
     
     def _generate_shadow_archer_sprite(self, state, frame):
         """Generate nimble archer sprite"""
+        # perf: draw-bound
         size = (56, 64)
         surface = pygame.Surface(size, pygame.SRCALPHA)
         
@@ -644,14 +677,14 @@ class SpriteManager:
         lean = -3 if state == "attacking" else 0
         
         # Legs (crouched stance)
-        pygame.draw.rect(surface, cloth_dark, (center_x - 5 + lean, base_y - 16, 4, 14))
-        pygame.draw.rect(surface, cloth_dark, (center_x + 1 + lean, base_y - 16, 4, 14))
+        pygame.draw.rect(surface, cloth_dark, self._rect(center_x - 5 + lean, base_y - 16, 4, 14))
+        pygame.draw.rect(surface, cloth_dark, self._rect(center_x + 1 + lean, base_y - 16, 4, 14))
         # Boots
-        pygame.draw.rect(surface, leather, (center_x - 6 + lean, base_y - 3, 5, 4))
-        pygame.draw.rect(surface, leather, (center_x + 1 + lean, base_y - 3, 5, 4))
+        pygame.draw.rect(surface, leather, self._rect(center_x - 6 + lean, base_y - 3, 5, 4))
+        pygame.draw.rect(surface, leather, self._rect(center_x + 1 + lean, base_y - 3, 5, 4))
         
         # Torso (light armor)
-        body_rect = pygame.Rect(center_x - 7 + lean, base_y - 34, 14, 20)
+        body_rect = self._rect(center_x - 7 + lean, base_y - 34, 14, 20, 1)
         pygame.draw.ellipse(surface, leather, body_rect)
         # Leather straps
         pygame.draw.line(surface, (60, 40, 20), 
@@ -663,12 +696,12 @@ class SpriteManager:
         
         # Arms
         # Left arm (bow holding)
-        pygame.draw.rect(surface, skin, (center_x - 12 + lean, base_y - 32, 3, 12))
+        pygame.draw.rect(surface, skin, self._rect(center_x - 12 + lean, base_y - 32, 3, 12))
         # Right arm (drawing)
-        pygame.draw.rect(surface, skin, (center_x + 9 + lean, base_y - 32, 3, 12))
+        pygame.draw.rect(surface, skin, self._rect(center_x + 9 + lean, base_y - 32, 3, 12))
         
         # Head (hooded)
-        head_rect = pygame.Rect(center_x - 6 + lean, base_y - 46, 12, 14)
+        head_rect = self._rect(center_x - 6 + lean, base_y - 46, 12, 14, 1)
         pygame.draw.ellipse(surface, skin, head_rect)
         # Hood
         hood_points = [
@@ -689,7 +722,7 @@ class SpriteManager:
         bow_top = base_y - 38
         bow_bottom = base_y - 18
         # Bow limbs (curved)
-        pygame.draw.arc(surface, wood, (bow_x - 4, bow_top, 8, 20), -1.57, 1.57, 3)
+        pygame.draw.arc(surface, wood, self._rect(bow_x - 4, bow_top, 8, 20), -1.57, 1.57, 3)
         # Bow string
         if state == "attacking":
             # Drawn back
@@ -706,21 +739,24 @@ class SpriteManager:
             pygame.draw.line(surface, (220, 220, 200),
                            (bow_x, bow_top), (bow_x, bow_bottom), 1)
         
-        # Quiver on back
-        pygame.draw.rect(surface, leather, (center_x + 4 + lean, base_y - 38, 4, 12))
-        # Arrow fletching visible
-        for i in range(3):
-            arrow_y = base_y - 36 + i * 3
-            pygame.draw.line(surface, (200, 50, 50), 
-                           (center_x + 5 + lean, arrow_y),
-                           (center_x + 7 + lean, arrow_y - 2), 1)
+        # Quiver on back (with arrow fletching), pre-baked once
+        if SpriteManager._QUIVER_STAMP is None:
+            stamp = pygame.Surface((4, 12), pygame.SRCALPHA)
+            pygame.draw.rect(stamp, leather, self._rect(0, 0, 4, 12))
+            for i in range(3):
+                pygame.draw.line(stamp, (200, 50, 50), (1, 2 + i * 3), (3, i * 3), 1)
+            SpriteManager._QUIVER_STAMP = stamp
+        surface.blit(SpriteManager._QUIVER_STAMP, (center_x + 4 + lean, base_y - 38))
         
         return surface
     
     def _generate_default_sprite(self, state, frame):
-        """Default sprite for unknown entities"""
-        size = (48, 48)
-        surface = pygame.Surface(size, pygame.SRCALPHA)
-        pygame.draw.rect(surface, (100, 100, 100), (12, 12, 24, 24))
-        pygame.draw.circle(surface, (150, 150, 150), (24, 24), 8)
-        return surface
+        """Default sprite for unknown entities (shared - callers must not mutate it)"""
+        # perf: built once; every later call is a class attribute read
+        if SpriteManager._DEFAULT_SPRITE is None:
+            size = (48, 48)
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surface, (100, 100, 100), self._rect(12, 12, 24, 24))
+            pygame.draw.circle(surface, (150, 150, 150), (24, 24), 8)
+            SpriteManager._DEFAULT_SPRITE = surface
+        return SpriteManager._DEFAULT_SPRITE
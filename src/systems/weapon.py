@@ -6,9 +6,29 @@ Supports combos, special abilities, and stat scaling
 
 import pygame
 import json
+import logging
 import os
 import math
-from typing import Optional, Tuple, List
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple, List
+
+logger = logging.getLogger(__name__)
+
+# Parsed weapon JSON keyed by (path, mtime, size), shared by all WeaponManagers
+_JSON_CACHE = {}
+
+
+class WeaponPhase(IntEnum):
+    """Weapon attack phases (ints so the per-tick compares stay cheap)"""
+    IDLE = 0
+    WINDUP = 1
+    ACTIVE = 2
+    RECOVERY = 3
+
+
+# Shared read-only result for idle ticks (the common case)
+_IDLE_RESULT = MappingProxyType({'phase': WeaponPhase.IDLE, 'frame': 0, 'hitbox_active': False})
 
 
 class Weapon:
@@ -17,6 +37,28 @@ class Weapon:
     All weapons inherit from this and can override attack behavior
     """
     
+    __slots__ = (
+        'id', 'name', 'description', 'weapon_type', 'rarity',
+        # Stats
+        'base_damage', 'attack_speed', 'crit_chance', 'crit_multiplier',
+        'knockback', 'range',
+        # Stamina costs
+        'stamina_light', 'stamina_heavy', 'stamina_finisher',
+        # Attack timing
+        'windup_frames', 'active_frames', 'recovery_frames', 'combo_window',
+        # Hitbox
+        'hitbox_width', 'hitbox_height', 'hitbox_offset_x', 'hitbox_offset_y',
+        'arc_sweep',
+        # Effects
+        'screen_shake', 'hit_freeze', 'particle_count', 'particle_color',
+        'stun_chance', 'stun_duration',
+        # Combo system
+        'combo_chain', 'special_ability',
+        # Current attack state
+        'current_attack_type', 'attack_frame', 'attack_phase',
+        'combo_count', 'combo_timer', '_phase_handlers',
+    )
+    
     def __init__(self, weapon_id: str, weapon_data: dict):
         """
         Initialize weapon from data
@@ -31,41 +73,47 @@ class Weapon:
         self.weapon_type = weapon_data['weapon_type']
         self.rarity = weapon_data['rarity']
         
+        stats = weapon_data['stats']
+        stamina = weapon_data['stamina']
+        timing = weapon_data['attack_timing']
+        hitbox = weapon_data['hitbox']
+        effects = weapon_data['effects']
+        
         # Stats
-        self.base_damage = weapon_data['stats']['base_damage']
-        self.attack_speed = weapon_data['stats']['attack_speed']
-        self.crit_chance = weapon_data['stats']['crit_chance']
-        self.crit_multiplier = weapon_data['stats']['crit_multiplier']
-        self.knockback = weapon_data['stats']['knockback']
-        self.range = weapon_data['stats']['range']
+        self.base_damage = stats['base_damage']
+        self.attack_speed = stats['attack_speed']
+        self.crit_chance = stats['crit_chance']
+        self.crit_multiplier = stats['crit_multiplier']
+        self.knockback = stats['knockback']
+        self.range = stats['range']
         
         # Stamina costs
-        self.stamina_light = weapon_data['stamina']['light_attack']
-        self.stamina_heavy = weapon_data['stamina']['heavy_attack']
-        self.stamina_finisher = weapon_data['stamina']['combo_finisher']
+        self.stamina_light = stamina['light_attack']
+        self.stamina_heavy = stamina['heavy_attack']
+        self.stamina_finisher = stamina['combo_finisher']
         
         # Attack timing (frames)
-        self.windup_frames = weapon_data['attack_timing']['windup_frames']
-        self.active_frames = weapon_data['attack_timing']['active_frames']
-        self.recovery_frames = weapon_data['attack_timing']['recovery_frames']
-        self.combo_window = weapon_data['attack_timing']['combo_window']
+        self.windup_frames = timing['windup_frames']
+        self.active_frames = timing['active_frames']
+        self.recovery_frames = timing['recovery_frames']
+        self.combo_window = timing['combo_window']
         
         # Hitbox
-        self.hitbox_width = weapon_data['hitbox']['width']
-        self.hitbox_height = weapon_data['hitbox']['height']
-        self.hitbox_offset_x = weapon_data['hitbox']['offset_x']
-        self.hitbox_offset_y = weapon_data['hitbox']['offset_y']
-        self.arc_sweep = weapon_data['hitbox']['arc_sweep']
+        self.hitbox_width = hitbox['width']
+        self.hitbox_height = hitbox['height']
+        self.hitbox_offset_x = hitbox['offset_x']
+        self.hitbox_offset_y = hitbox['offset_y']
+        self.arc_sweep = hitbox['arc_sweep']
         
         # Visual effects
-        self.screen_shake = weapon_data['effects']['screen_shake']
-        self.hit_freeze = weapon_data['effects']['hit_freeze']
-        self.particle_count = weapon_data['effects']['particle_count']
-        self.particle_color = tuple(weapon_data['effects']['particle_color'])
+        self.screen_shake = effects['screen_shake']
+        self.hit_freeze = effects['hit_freeze']
+        self.particle_count = effects['particle_count']
+        self.particle_color = tuple(effects['particle_color'])
         
         # Special effects (if any)
-        self.stun_chance = weapon_data['effects'].get('stun_chance', 0.0)
-        self.stun_duration = weapon_data['effects'].get('stun_duration', 0)
+        self.stun_chance = effects.get('stun_chance', 0.0)
+        self.stun_duration = effects.get('stun_duration', 0)
         
         # Combo system
         self.combo_chain = weapon_data['combo_chain']
@@ -74,10 +122,18 @@ class Weapon:
         # Current attack state
         self.current_attack_type = 'light'  # light, heavy, finisher
         self.attack_frame = 0
-        self.attack_phase = 'idle'  # idle, windup, active, recovery
+        self.attack_phase = WeaponPhase.IDLE
         self.combo_count = 0
         self.combo_timer = 0
         
+        # Per-phase tick handlers, indexed by WeaponPhase
+        self._phase_handlers = (
+            self._tick_idle,
+            self._tick_windup,
+            self._tick_active,
+            self._tick_recovery,
+        )
+        
     def start_attack(self, attack_type: str = 'light') -> bool:
         """
         Start an attack with this weapon
@@ -88,69 +144,79 @@ class Weapon:
         Returns:
             True if attack started successfully
         """
-        if self.attack_phase != 'idle':
+        if self.attack_phase != WeaponPhase.IDLE:
             return False
         
         self.current_attack_type = attack_type
         self.attack_frame = 0
-        self.attack_phase = 'windup'
+        self.attack_phase = WeaponPhase.WINDUP
         self.combo_timer = self.combo_window
         
         return True
     
-    def update(self) -> dict:
+    def update(self) -> Mapping:
         """
         Update weapon state
         
         Returns:
-            Dictionary with current frame info (phase, frame, hitbox_active)
+            Mapping with current frame info (phase, frame, hitbox_active).
+            Idle ticks return a shared read-only mapping.
         """
         # Safety check for infinite loops
         if self.attack_frame > 1000:
-            self.attack_phase = 'idle'
+            self.attack_phase = WeaponPhase.IDLE
             self.attack_frame = 0
-            return {'phase': 'idle', 'frame': 0, 'hitbox_active': False}
-        
-        if self.attack_phase == 'idle':
-            # Decrement combo timer
-            if self.combo_timer > 0:
-                self.combo_timer -= 1
-                if self.combo_timer == 0:
-                    self.combo_count = 0
-            return {'phase': 'idle', 'frame': 0, 'hitbox_active': False}
+            return _IDLE_RESULT
         
         prev_phase = self.attack_phase
-        self.attack_frame += 1
         
         # State transitions
-        if self.attack_phase == 'windup':
-            if self.attack_frame >= self.windup_frames:
-                self.attack_phase = 'active'
-                self.attack_frame = 0
-        
-        elif self.attack_phase == 'active':
-            if self.attack_frame >= self.active_frames:
-                self.attack_phase = 'recovery'
-                self.attack_frame = 0
-        
-        elif self.attack_phase == 'recovery':
-            if self.attack_frame >= self.recovery_frames:
-                self.attack_phase = 'idle'
-                self.attack_frame = 0
-                self.combo_count += 1
-                if self.combo_count >= len(self.combo_chain):
-                    self.combo_count = 0
+        self._phase_handlers[prev_phase]()
+        
+        if prev_phase == WeaponPhase.IDLE:
+            return _IDLE_RESULT
         
         # Debug: Log phase transitions
-        if prev_phase != self.attack_phase:
-            print(f"[Weapon] {prev_phase} -> {self.attack_phase}")
+        if prev_phase != self.attack_phase and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Weapon %s -> %s", prev_phase.name, self.attack_phase.name)
         
         return {
             'phase': self.attack_phase,
             'frame': self.attack_frame,
-            'hitbox_active': self.attack_phase == 'active'
+            'hitbox_active': self.attack_phase == WeaponPhase.ACTIVE
         }
     
+    def _tick_idle(self):
+        """Idle tick: count down the combo window"""
+        if self.combo_timer > 0:
+            self.combo_timer -= 1
+            if self.combo_timer == 0:
+                self.combo_count = 0
+    
+    def _tick_windup(self):
+        """Windup tick: advance to active once windup frames elapse"""
+        self.attack_frame += 1
+        if self.attack_frame >= self.windup_frames:
+            self.attack_phase = WeaponPhase.ACTIVE
+            self.attack_frame = 0
+    
+    def _tick_active(self):
+        """Active tick: advance to recovery once active frames elapse"""
+        self.attack_frame += 1
+        if self.attack_frame >= self.active_frames:
+            self.attack_phase = WeaponPhase.RECOVERY
+            self.attack_frame = 0
+    
+    def _tick_recovery(self):
+        """Recovery tick: return to idle and advance the combo chain"""
+        self.attack_frame += 1
+        if self.attack_frame >= self.recovery_frames:
+            self.attack_phase = WeaponPhase.IDLE
+            self.attack_frame = 0
+            self.combo_count += 1
+            if self.combo_count >= len(self.combo_chain):
+                self.combo_count = 0
+    
     def get_hitbox(self, player_rect: pygame.Rect, facing_right: bool) -> Optional[pygame.Rect]:
         """
         Calculate attack hitbox based on player position and facing direction
@@ -162,7 +228,7 @@ class Weapon:
         Returns:
             Pygame Rect for hitbox, or None if attack not active
         """
-        if self.attack_phase != 'active':
+        if self.attack_phase != WeaponPhase.ACTIVE:
             return None
         
         # Calculate hitbox position
@@ -223,7 +289,7 @@ class Weapon:
         Returns:
             True if can cancel (during windup phase)
         """
-        return self.attack_phase == 'windup'
+        return self.attack_phase == WeaponPhase.WINDUP
     
     def is_attack_active(self) -> bool:
         """
@@ -232,11 +298,11 @@ class Weapon:
         Returns:
             True if in active phase
         """
-        return self.attack_phase == 'active'
+        return self.attack_phase == WeaponPhase.ACTIVE
     
     def reset(self):
         """Reset weapon to idle state"""
-        self.attack_phase = 'idle'
+        self.attack_phase = WeaponPhase.IDLE
         self.attack_frame = 0
         self.combo_count = 0
         self.combo_timer = 0
@@ -262,7 +328,7 @@ class Weapon:
             )
             
             # Draw hitbox
-            color = (255, 0, 0, 128) if self.attack_phase == 'active' else (255, 255, 0, 128)
+            color = (255, 0, 0, 128) if self.attack_phase == WeaponPhase.ACTIVE else (255, 255, 0, 128)
             pygame.draw.rect(surface, color, screen_hitbox, 2)
             
             # Draw arc indicator
@@ -290,7 +356,7 @@ class WeaponManager:
         self.stamina_config = {}
         self.combat_modifiers = {}
         
-        self.weapons = {}  # weapon_id -> Weapon instance
+        self._weapon_cache = {}  # weapon_id -> Weapon instance, built on first use
         self.current_weapon_id = 'sword'
         
         self.load_weapon_data()
@@ -301,17 +367,22 @@ class WeaponManager:
             print(f"Warning: Weapon data not found at {self.data_path}")
             return
         
-        with open(self.data_path, 'r') as f:
-            data = json.load(f)
+        # Reuse the parsed file if it hasn't changed since the last load
+        stat = os.stat(self.data_path)
+        cache_key = (os.path.abspath(self.data_path), stat.st_mtime, stat.st_size)
+        data = _JSON_CACHE.get(cache_key)
+        if data is None:
+            with open(self.data_path, 'r') as f:
+                data = json.load(f)
+            _JSON_CACHE[cache_key] = data
         
         self.weapon_data = data.get('weapons', {})
         self.scaling_data = data.get('weapon_scaling', {})
         self.stamina_config = data.get('stamina_system', {})
         self.combat_modifiers = data.get('combat_modifiers', {})
         
-        # Create weapon instances
-        for weapon_id, weapon_info in self.weapon_data.items():
-            self.weapons[weapon_id] = Weapon(weapon_id, weapon_info)
+        # Weapon instances are created lazily by get_weapon()
+        self._weapon_cache.clear()
     
     def get_weapon(self, weapon_id: str) -> Optional[Weapon]:
         """
@@ -323,11 +394,18 @@ class WeaponManager:
         Returns:
             Weapon instance or None if not found
         """
-        return self.weapons.get(weapon_id)
+        weapon = self._weapon_cache.get(weapon_id)
+        if weapon is None and weapon_id in self.weapon_data:
+            weapon = Weapon(weapon_id, self.weapon_data[weapon_id])
+            self._weapon_cache[weapon_id] = weapon
+        return weapon
     
     def get_current_weapon(self) -> Weapon:
         """Get currently equipped weapon"""
-        return self.weapons.get(self.current_weapon_id, list(self.weapons.values())[0])
+        weapon = self.get_weapon(self.current_weapon_id)
+        if weapon is None:
+            weapon = self.get_weapon(list(self.weapon_data)[0])
+        return weapon
     
     def switch_weapon(self, weapon_id: str) -> bool:
         """
@@ -339,7 +417,7 @@ class WeaponManager:
         Returns:
             True if switched successfully
         """
-        if weapon_id in self.weapons:
+        if weapon_id in self.weapon_data:
             # Reset current weapon
             current = self.get_current_weapon()
             if current:
@@ -356,7 +434,7 @@ class WeaponManager:
         Returns:
             List of weapon IDs
         """
-        return list(self.weapons.keys())
+        return list(self.weapon_data.keys())
     
     def get_stamina_config(self) -> dict:
         """Get stamina system configuration"""
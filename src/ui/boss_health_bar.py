@@ -49,6 +49,28 @@ class BossHealthBar:
         self.COLOR_TEXT = (255, 255, 255)
         self.COLOR_PHASE_MARKER = (255, 215, 0)  # Gold
         
+        # Translucent bar background (size and color never change)
+        self._bg_surface = pygame.Surface((self.bar_width, self.bar_height), pygame.SRCALPHA)
+        self._bg_surface.fill(self.COLOR_BACKGROUND)
+        
+        # Gold outline, also fixed
+        self._outline_surface = pygame.Surface((self.bar_width, self.bar_height), pygame.SRCALPHA)
+        pygame.draw.rect(self._outline_surface, self.COLOR_OUTLINE, self._outline_surface.get_rect(), 3)
+        
+        # Health color for every integer percent (0-100)
+        self._health_gradient = [self._compute_color_for_pct(p / 100.0) for p in range(101)]
+        
+        # Health fill baked as a 0%..100% gradient strip; draw() blits the
+        # left health_width pixels of it. Damage flash is a white overlay.
+        inner_width = self.bar_width - 6
+        inner_height = self.bar_height - 6
+        self._gradient_strip = pygame.Surface((inner_width, inner_height))
+        for x in range(inner_width):
+            color = self._health_gradient[int(x / inner_width * 100)]
+            self._gradient_strip.fill(color, (x, 0, 1, inner_height))
+        self._flash_overlay = pygame.Surface((inner_width, inner_height))
+        self._flash_overlay.fill((255, 255, 255))
+        
         # Animation
         self.slide_in_timer = 0
         self.slide_in_duration = 60  # 1 second
@@ -63,6 +85,18 @@ class BossHealthBar:
         self.boss_name = ""
         self.current_health_percent = 1.0
         
+        # Pre-rendered name text (built in activate)
+        self._name_surf: Optional[pygame.Surface] = None
+        self._name_shadow: Optional[pygame.Surface] = None
+        self._markers_overlay: Optional[pygame.Surface] = None
+        
+        # Rendered "N%" labels keyed by integer percent (at most 101 entries)
+        self._health_text_cache: dict = {}
+        
+        # Whole bar pre-composited; rebuilt when _composite_key changes
+        self._composite = pygame.Surface((self.bar_width, self.bar_height), pygame.SRCALPHA)
+        self._composite_key: Optional[tuple] = None
+        
     def activate(self, boss_name: str, phase_thresholds: list):
         """
         Activate the boss health bar
@@ -77,12 +111,29 @@ class BossHealthBar:
         self.slide_in_timer = 0
         self.current_health_percent = 1.0
         self.previous_health = 1.0
+        
+        # Name only changes here, so render it once instead of every frame
+        self._name_surf = self.font_boss_name.render(boss_name, True, self.COLOR_TEXT).convert_alpha()
+        self._name_shadow = self.font_boss_name.render(boss_name, True, (0, 0, 0)).convert_alpha()
+        
+        # Phase markers (vertical lines at phase thresholds) are fixed for the fight
+        self._markers_overlay = pygame.Surface((self.bar_width, self.bar_height), pygame.SRCALPHA)
+        for threshold in self.phase_thresholds:
+            if threshold < 1.0:  # Don't draw marker at 100%
+                marker_x = int((self.bar_width - 6) * threshold)
+                marker_rect = pygame.Rect(marker_x, 3, 3, self.bar_height - 6)
+                pygame.draw.rect(self._markers_overlay, self.COLOR_PHASE_MARKER, marker_rect)
+        self._composite_key = None
     
     def deactivate(self):
         """Deactivate the boss health bar"""
         self.is_active = False
         self.boss_name = ""
         self.phase_thresholds = []
+        self._name_surf = None
+        self._name_shadow = None
+        self._markers_overlay = None
+        self._composite_key = None
     
     def update(self, boss):
         """
@@ -129,84 +180,104 @@ class BossHealthBar:
         current_bar_y = self.bar_y + slide_offset
         current_name_y = self.name_y + slide_offset
         
+        # Skip everything while the whole widget is still above the screen
+        if (current_bar_y + self.bar_height <= 0
+                and current_name_y + self.font_boss_name.get_height() <= 0):
+            return
+        
         # Draw boss name (large, center-top)
-        name_surface = self.font_boss_name.render(self.boss_name, True, self.COLOR_TEXT)
+        name_surface = self._name_surf
         name_rect = name_surface.get_rect(center=(self.screen_width // 2, current_name_y))
         
         # Name shadow for visibility
-        name_shadow = self.font_boss_name.render(self.boss_name, True, (0, 0, 0))
+        name_shadow = self._name_shadow
         shadow_rect = name_shadow.get_rect(center=(self.screen_width // 2 + 3, current_name_y + 3))
         surface.blit(name_shadow, shadow_rect)
         surface.blit(name_surface, name_rect)
         
-        # Draw health bar background
-        bg_rect = pygame.Rect(self.bar_x, current_bar_y, self.bar_width, self.bar_height)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surface.fill(self.COLOR_BACKGROUND)
-        surface.blit(bg_surface, bg_rect)
-        
-        # Draw outline (gold, thick)
-        pygame.draw.rect(surface, self.COLOR_OUTLINE, bg_rect, 3)
-        
-        # Draw lost health (dark red background)
-        lost_health_rect = pygame.Rect(
-            self.bar_x + 3,
-            current_bar_y + 3,
-            self.bar_width - 6,
-            self.bar_height - 6
-        )
-        pygame.draw.rect(surface, self.COLOR_HEALTH_LOST, lost_health_rect)
-        
-        # Draw current health (with color gradient based on health level)
+        # Draw the bar, re-compositing only when its contents change
         if self.current_health_percent > 0:
             health_width = int((self.bar_width - 6) * self.current_health_percent)
-            
-            # Color based on health
-            if self.current_health_percent > 0.6:
-                health_color = self.COLOR_HEALTH_HIGH
-            elif self.current_health_percent > 0.3:
-                # Interpolate between high and medium
-                t = (self.current_health_percent - 0.3) / 0.3
-                health_color = self._lerp_color(self.COLOR_HEALTH_MED, self.COLOR_HEALTH_HIGH, t)
-            else:
-                # Interpolate between low and medium
-                t = self.current_health_percent / 0.3
-                health_color = self._lerp_color(self.COLOR_HEALTH_LOW, self.COLOR_HEALTH_MED, t)
+        else:
+            health_width = 0
+        flash_alpha = 0
+        if self.damage_flash_timer > 0:
+            flash_intensity = self.damage_flash_timer / 15
+            flash_alpha = int(255 * flash_intensity * 0.5)
+        pct_int = int(self.current_health_percent * 100)
+        
+        composite_key = (health_width, flash_alpha, pct_int)
+        if composite_key != self._composite_key:
+            self._rebuild_composite(health_width, flash_alpha, pct_int)
+            self._composite_key = composite_key
+        surface.blit(self._composite, (self.bar_x, current_bar_y))
+    
+    def _rebuild_composite(self, health_width: int, flash_alpha: int, pct_int: int):
+        """
+        Render the whole bar (background, outline, fill, markers, text) into
+        the composite surface, in bar-local coordinates
+        
+        Args:
+            health_width: Width of the current-health fill in pixels
+            flash_alpha: Damage flash overlay alpha (0 for none)
+            pct_int: Health percentage shown as text
+        """
+        composite = self._composite
+        composite.fill((0, 0, 0, 0))
+        
+        # Health bar background and outline (gold, thick)
+        composite.blit(self._bg_surface, (0, 0))
+        composite.blit(self._outline_surface, (0, 0))
+        
+        # Lost health (dark red background)
+        composite.fill(self.COLOR_HEALTH_LOST, (3, 3, self.bar_width - 6, self.bar_height - 6))
+        
+        # Current health (gradient strip cropped to health level)
+        if health_width > 0:
+            health_area = pygame.Rect(0, 0, health_width, self.bar_height - 6)
+            composite.blit(self._gradient_strip, (3, 3), health_area)
             
             # Flash effect when taking damage
-            if self.damage_flash_timer > 0:
-                flash_intensity = self.damage_flash_timer / 15
-                health_color = self._lerp_color(health_color, (255, 255, 255), flash_intensity * 0.5)
-            
-            health_rect = pygame.Rect(
-                self.bar_x + 3,
-                current_bar_y + 3,
-                health_width,
-                self.bar_height - 6
-            )
-            pygame.draw.rect(surface, health_color, health_rect)
-        
-        # Draw phase markers (vertical lines at phase thresholds)
-        for threshold in self.phase_thresholds:
-            if threshold < 1.0:  # Don't draw marker at 100%
-                marker_x = self.bar_x + int((self.bar_width - 6) * threshold)
-                marker_rect = pygame.Rect(
-                    marker_x,
-                    current_bar_y + 3,
-                    3,
-                    self.bar_height - 6
-                )
-                pygame.draw.rect(surface, self.COLOR_PHASE_MARKER, marker_rect)
-        
-        # Draw health percentage text
-        health_text = f"{int(self.current_health_percent * 100)}%"
-        health_surface = self.font_health.render(health_text, True, self.COLOR_TEXT)
+            if flash_alpha > 0:
+                self._flash_overlay.set_alpha(flash_alpha)
+                composite.blit(self._flash_overlay, (3, 3), health_area)
+        
+        # Phase markers (pre-rendered in activate)
+        composite.blit(self._markers_overlay, (0, 0))
+        
+        # Health percentage text
+        health_surface = self._health_text_cache.get(pct_int)
+        if health_surface is None:
+            health_surface = self.font_health.render(f"{pct_int}%", True, self.COLOR_TEXT)
+            self._health_text_cache[pct_int] = health_surface
         health_rect = health_surface.get_rect(
-            center=(self.screen_width // 2, current_bar_y + self.bar_height // 2)
+            center=(self.screen_width // 2 - self.bar_x, self.bar_height // 2)
         )
-        surface.blit(health_surface, health_rect)
+        composite.blit(health_surface, health_rect)
+    
+    def _compute_color_for_pct(self, pct: float) -> tuple:
+        """
+        Health bar color for a given health percentage
+        
+        Args:
+            pct: Health percentage (0.0 to 1.0)
+            
+        Returns:
+            Bar color (R, G, B)
+        """
+        if pct > 0.6:
+            return self.COLOR_HEALTH_HIGH
+        elif pct > 0.3:
+            # Interpolate between high and medium
+            t = (pct - 0.3) / 0.3
+            return self._lerp_color(self.COLOR_HEALTH_MED, self.COLOR_HEALTH_HIGH, t)
+        else:
+            # Interpolate between low and medium
+            t = pct / 0.3
+            return self._lerp_color(self.COLOR_HEALTH_LOW, self.COLOR_HEALTH_MED, t)
     
-    def _lerp_color(self, color1: tuple, color2: tuple, t: float) -> tuple:
+    @staticmethod
+    def _lerp_color(color1: tuple, color2: tuple, t: float) -> tuple:
         """
         Linear interpolation between two colors
         
@@ -218,8 +289,9 @@ class BossHealthBar:
         Returns:
             Interpolated color
         """
+        inv = 1.0 - t
         return (
-            int(color1[0] + (color2[0] - color1[0]) * t),
-            int(color1[1] + (color2[1] - color1[1]) * t),
-            int(color1[2] + (color2[2] - color1[2]) * t)
+            int(color1[0] * inv + color2[0] * t),
+            int(color1[1] * inv + color2[1] * t),
+            int(color1[2] * inv + color2[2] * t)
         )
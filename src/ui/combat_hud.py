@@ -6,6 +6,18 @@ Professional UI for the combat system
 import pygame
 from typing import Optional
 
+from src.core.resources import SurfaceCache
+
+
+# Weapon name -> number key that equips it
+_WEAPON_HOTKEYS = {
+    'sword': '1',
+    'dagger': '2',
+    'greatsword': '3',
+    'spear': '4',
+    'hammer': '5'
+}
+
 
 class CombatHUD:
     """
@@ -29,6 +41,11 @@ class CombatHUD:
         self.font_small = pygame.font.Font(None, 24)
         self.font_medium = pygame.font.Font(None, 32)
         self.font_large = pygame.font.Font(None, 48)
+        # Combo fonts scale with combo count (up to 2x at 10 hits)
+        self._combo_fonts = [
+            pygame.font.Font(None, int(48 * (1.0 + (count * 0.1))))
+            for count in range(11)
+        ]
         
         # HUD positioning (top-left corner near health/XP bars)
         self.hud_x = 30
@@ -65,6 +82,85 @@ class CombatHUD:
         self.COLOR_TEXT_DIM = (180, 180, 180)        # Dim text
         self.COLOR_COMBO = (255, 200, 50)            # Gold for combo
         
+        # Rendered text surfaces keyed by (font, text, color[, outline])
+        self._text_cache = SurfaceCache(256)
+        # Last stamina / weapon stat text, reused while the numbers hold
+        self._last_stamina_int = -1
+        self._last_stamina_max = -1
+        self._last_stamina_text_surface = None
+        self._last_stamina_text_rect = None
+        self._last_stats_text_key = None
+        self._last_stats_text_surfaces = None
+        
+        # Stamina color for every integer percent (0-100)
+        self._stamina_color_lut = [self._compute_stamina_color(p / 100.0) for p in range(101)]
+        # Combo text color for every combo flash timer value
+        self._combo_flash_lut = [
+            self._lerp_color(self.COLOR_COMBO, (255, 255, 255), t / self.combo_flash_duration)
+            for t in range(self.combo_flash_duration + 1)
+        ]
+        # Exhausted pulse color for every millisecond of the 1s cycle
+        self._pulse_color_lut = [
+            self._lerp_color(self.COLOR_STAMINA_LOW, (255, 50, 50), abs(ms / 500 - 1) * 0.5)
+            for ms in range(1000)
+        ]
+        
+        # Stamina bar chrome (outline, background, label) never moves
+        self._build_static_layer()
+        
+        # Bar rects reused every frame; only their widths change
+        self._stamina_fill_rect = pygame.Rect(
+            self.hud_x, 
+            self.stamina_bar_y, 
+            self.stamina_bar_width, 
+            self.stamina_bar_height
+        )
+        self._combo_timer_bg_rect = pygame.Rect(self.combo_x - 100, self.combo_y + 40, 200, 6)
+        self._combo_timer_rect = self._combo_timer_bg_rect.copy()
+        
+        # Weapon switch flash, re-filled each frame of the animation
+        self._weapon_flash_surface = self._to_display_format(
+            pygame.Surface((300, 80), pygame.SRCALPHA)
+        )
+        
+        # Stamina + weapon panel, re-rendered only when what it shows changes.
+        # Anchored at the screen origin so panel drawing uses screen coordinates.
+        self._panel = self._to_display_format(
+            pygame.Surface((400, self.weapon_indicator_y + 80), pygame.SRCALPHA)
+        )
+        self._panel_state = None
+        self._panel_rect = self._panel.get_rect()
+        
+        # Screen regions the last draw() changed, and where the combo was drawn
+        self._dirty_rects = []
+        self._combo_rect = None
+        
+    def _build_static_layer(self):
+        """Pre-render the stamina bar chrome onto one tightly-sized surface"""
+        bg_rect = pygame.Rect(
+            self.hud_x, 
+            self.stamina_bar_y, 
+            self.stamina_bar_width, 
+            self.stamina_bar_height
+        )
+        outline_rect = bg_rect.inflate(4, 4)
+        label = self.font_small.render("STAMINA", True, self.COLOR_TEXT_DIM)
+        label_rect = label.get_rect(
+            bottomleft=(self.hud_x, self.stamina_bar_y - 5)
+        )
+        
+        bounds = outline_rect.union(label_rect)
+        self._static_layer_pos = bounds.topleft
+        self._static_layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        
+        offset = (-bounds.x, -bounds.y)
+        self._static_layer.fill(self.COLOR_OUTLINE, outline_rect.move(offset))
+        # The screen has no per-pixel alpha, so the background has always
+        # drawn opaque; keep that look
+        self._static_layer.fill(self.COLOR_BACKGROUND[:3], bg_rect.move(offset))
+        self._static_layer.blit(label, label_rect.move(offset))
+        self._static_layer = self._to_display_format(self._static_layer)
+    
     def draw_stamina_bar(self, surface: pygame.Surface, current_stamina: float, 
                         max_stamina: float, regen_delay: int, exhausted: bool):
         """
@@ -80,47 +176,25 @@ class CombatHUD:
         # Calculate stamina percentage
         stamina_percent = current_stamina / max_stamina if max_stamina > 0 else 0
         
-        # Background bar (dark)
-        bg_rect = pygame.Rect(
-            self.hud_x, 
-            self.stamina_bar_y, 
-            self.stamina_bar_width, 
-            self.stamina_bar_height
-        )
-        pygame.draw.rect(surface, self.COLOR_OUTLINE, bg_rect.inflate(4, 4))
-        pygame.draw.rect(surface, self.COLOR_BACKGROUND, bg_rect)
-        
-        # Foreground bar (colored based on stamina level)
-        if stamina_percent > 0:
-            # Color interpolation based on stamina level
-            if stamina_percent > 0.6:
-                color = self.COLOR_STAMINA_FULL
-            elif stamina_percent > 0.3:
-                # Interpolate between green and yellow
-                t = (stamina_percent - 0.3) / 0.3
-                color = self._lerp_color(self.COLOR_STAMINA_MED, self.COLOR_STAMINA_FULL, t)
-            else:
-                # Interpolate between red and yellow
-                t = stamina_percent / 0.3
-                color = self._lerp_color(self.COLOR_STAMINA_LOW, self.COLOR_STAMINA_MED, t)
-            
-            # Add pulsing effect when exhausted
+        # Static chrome: outline, dark background and "STAMINA" label
+        surface.blit(self._static_layer, self._static_layer_pos)
+        
+        # Foreground bar (colored based on stamina level), clamped to the bar
+        stamina_width = min(self.stamina_bar_width, int(self.stamina_bar_width * stamina_percent))
+        if stamina_width > 0:
             if exhausted:
-                pulse = abs((pygame.time.get_ticks() % 1000) / 500 - 1)  # 0 to 1 to 0
-                color = self._lerp_color(self.COLOR_STAMINA_LOW, (255, 50, 50), pulse * 0.5)
+                # Pulsing effect when exhausted
+                color = self._pulse_color_lut[pygame.time.get_ticks() % 1000]
+            else:
+                # Color based on stamina level
+                color = self._stamina_color_lut[min(100, int(stamina_percent * 100))]
             
-            stamina_width = int(self.stamina_bar_width * stamina_percent)
-            stamina_rect = pygame.Rect(
-                self.hud_x, 
-                self.stamina_bar_y, 
-                stamina_width, 
-                self.stamina_bar_height
-            )
-            pygame.draw.rect(surface, color, stamina_rect)
+            self._stamina_fill_rect.width = stamina_width
+            surface.fill(color, self._stamina_fill_rect)
         
         # Regen delay indicator (orange overlay on right side)
         if regen_delay > 0:
-            delay_text = self.font_small.render("!", True, self.COLOR_STAMINA_DELAY)
+            delay_text = self._render_cached(self.font_small, "!", self.COLOR_STAMINA_DELAY)
             delay_pos = (
                 self.hud_x + self.stamina_bar_width + 10,
                 self.stamina_bar_y
@@ -128,20 +202,20 @@ class CombatHUD:
             surface.blit(delay_text, delay_pos)
         
         # Stamina text (current/max)
-        stamina_text = f"{int(current_stamina)}/{int(max_stamina)}"
-        text_surface = self.font_small.render(stamina_text, True, self.COLOR_TEXT)
-        text_rect = text_surface.get_rect(
-            midleft=(self.hud_x + self.stamina_bar_width + 30, 
-                    self.stamina_bar_y + self.stamina_bar_height // 2)
-        )
-        surface.blit(text_surface, text_rect)
-        
-        # "STAMINA" label
-        label = self.font_small.render("STAMINA", True, self.COLOR_TEXT_DIM)
-        label_rect = label.get_rect(
-            bottomleft=(self.hud_x, self.stamina_bar_y - 5)
-        )
-        surface.blit(label, label_rect)
+        stamina_int = int(current_stamina)
+        stamina_max = int(max_stamina)
+        if stamina_int != self._last_stamina_int or stamina_max != self._last_stamina_max:
+            stamina_text = f"{stamina_int}/{stamina_max}"
+            self._last_stamina_text_surface = self._render_cached(
+                self.font_small, stamina_text, self.COLOR_TEXT
+            )
+            self._last_stamina_text_rect = self._last_stamina_text_surface.get_rect(
+                midleft=(self.hud_x + self.stamina_bar_width + 30, 
+                        self.stamina_bar_y + self.stamina_bar_height // 2)
+            )
+            self._last_stamina_int = stamina_int
+            self._last_stamina_max = stamina_max
+        surface.blit(self._last_stamina_text_surface, self._last_stamina_text_rect)
     
     def draw_weapon_indicator(self, surface: pygame.Surface, weapon_name: str, 
                              weapon_damage: int, weapon_type: str, hotkey: str,
@@ -163,13 +237,13 @@ class CombatHUD:
         y_pos = self.weapon_indicator_y
         
         # Weapon name (larger, bold)
-        name_surface = self.font_medium.render(weapon_name.upper(), True, self.COLOR_TEXT)
+        name_surface = self._render_cached(self.font_medium, weapon_name.upper(), self.COLOR_TEXT)
         name_rect = name_surface.get_rect(topleft=(self.hud_x, y_pos))
         surface.blit(name_surface, name_rect)
         
         # Hotkey indicator (small, in brackets)
         hotkey_text = f"[{hotkey}]"
-        hotkey_surface = self.font_small.render(hotkey_text, True, self.COLOR_TEXT_DIM)
+        hotkey_surface = self._render_cached(self.font_small, hotkey_text, self.COLOR_TEXT_DIM)
         hotkey_rect = hotkey_surface.get_rect(
             midleft=(name_rect.right + 10, name_rect.centery)
         )
@@ -179,26 +253,30 @@ class CombatHUD:
         if self.weapon_switch_timer > 0:
             self.weapon_switch_timer -= 1
             alpha = int((self.weapon_switch_timer / self.weapon_switch_duration) * 100)
-            flash_surface = pygame.Surface((300, 80), pygame.SRCALPHA)
-            flash_surface.fill((255, 200, 50, alpha))
-            surface.blit(flash_surface, (self.hud_x - 10, y_pos - 10))
+            self._weapon_flash_surface.fill((255, 200, 50, alpha))
+            surface.blit(self._weapon_flash_surface, (self.hud_x - 10, y_pos - 10))
         
         # Stats (small text below name)
         stats_y = y_pos + 35
         
-        # Damage
-        dmg_text = f"DMG: {weapon_damage}"
-        dmg_surface = self.font_small.render(dmg_text, True, self.COLOR_TEXT_DIM)
+        stats_key = (weapon_damage, attack_speed, stamina_cost_light, stamina_cost_heavy)
+        if stats_key != self._last_stats_text_key:
+            self._last_stats_text_surfaces = (
+                # Damage
+                self._render_cached(self.font_small, f"DMG: {weapon_damage}", 
+                                    self.COLOR_TEXT_DIM),
+                # Attack speed
+                self._render_cached(self.font_small, f"SPD: {attack_speed:.1f}x", 
+                                    self.COLOR_TEXT_DIM),
+                # Stamina costs
+                self._render_cached(self.font_small, 
+                                    f"L:{stamina_cost_light} H:{stamina_cost_heavy}", 
+                                    self.COLOR_TEXT_DIM)
+            )
+            self._last_stats_text_key = stats_key
+        dmg_surface, speed_surface, stamina_surface = self._last_stats_text_surfaces
         surface.blit(dmg_surface, (self.hud_x, stats_y))
-        
-        # Attack speed
-        speed_text = f"SPD: {attack_speed:.1f}x"
-        speed_surface = self.font_small.render(speed_text, True, self.COLOR_TEXT_DIM)
         surface.blit(speed_surface, (self.hud_x + 80, stats_y))
-        
-        # Stamina costs
-        stamina_text = f"L:{stamina_cost_light} H:{stamina_cost_heavy}"
-        stamina_surface = self.font_small.render(stamina_text, True, self.COLOR_TEXT_DIM)
         surface.blit(stamina_surface, (self.hud_x + 170, stats_y))
     
     def draw_combo_counter(self, surface: pygame.Surface, combo_count: int, 
@@ -221,47 +299,31 @@ class CombatHUD:
         combo_text = f"{combo_count} HIT COMBO!"
         
         # Scale text based on combo count (bigger = better)
-        scale = 1.0 + (min(combo_count, 10) * 0.1)  # Up to 2x at 10 hits
-        font_size = int(48 * scale)
-        combo_font = pygame.font.Font(None, font_size)
+        combo_font = self._combo_fonts[min(combo_count, 10)]
         
         # Flash effect when combo increases
         if self.combo_flash_timer > 0:
             self.combo_flash_timer -= 1
-            flash_intensity = self.combo_flash_timer / self.combo_flash_duration
-            color = self._lerp_color(self.COLOR_COMBO, (255, 255, 255), flash_intensity)
-        else:
-            color = self.COLOR_COMBO
+        color = self._combo_flash_lut[self.combo_flash_timer]
         
-        # Main combo text
-        text_surface = combo_font.render(combo_text, True, color)
+        # Main combo text with outline for visibility
+        text_surface = self._render_outlined(combo_font, combo_text, color, (0, 0, 0))
         text_rect = text_surface.get_rect(center=(self.combo_x, self.combo_y))
-        
-        # Outline for visibility
-        outline_surface = combo_font.render(combo_text, True, (0, 0, 0))
-        for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-            outline_rect = text_surface.get_rect(center=(self.combo_x + dx, self.combo_y + dy))
-            surface.blit(outline_surface, outline_rect)
-        
         surface.blit(text_surface, text_rect)
+        self._combo_rect = text_rect
         
         # Combo timer bar (shows remaining time)
         if combo_timer > 0:
+            self._combo_rect = text_rect.union(self._combo_timer_bg_rect)
             timer_percent = combo_timer / combo_window
-            bar_width = 200
-            bar_height = 6
-            bar_x = self.combo_x - bar_width // 2
-            bar_y = self.combo_y + 40
             
             # Background
-            bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-            pygame.draw.rect(surface, (40, 40, 40), bg_rect)
+            surface.fill((40, 40, 40), self._combo_timer_bg_rect)
             
             # Foreground (timer)
-            timer_width = int(bar_width * timer_percent)
+            self._combo_timer_rect.width = int(self._combo_timer_bg_rect.width * timer_percent)
             timer_color = self._lerp_color((255, 50, 50), (255, 200, 50), timer_percent)
-            timer_rect = pygame.Rect(bar_x, bar_y, timer_width, bar_height)
-            pygame.draw.rect(surface, timer_color, timer_rect)
+            surface.fill(timer_color, self._combo_timer_rect)
     
     def trigger_combo_flash(self):
         """Trigger flash animation when combo increases"""
@@ -271,6 +333,89 @@ class CombatHUD:
         """Trigger flash animation when weapon switches"""
         self.weapon_switch_timer = self.weapon_switch_duration
     
+    def _render_cached(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Render text, reusing the surface from a previous identical render
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+            
+        Returns:
+            Rendered text surface (shared - do not modify)
+        """
+        return self._text_cache.get(
+            (font, text, color),
+            lambda: self._to_display_format(font.render(text, True, color))
+        )
+    
+    def _render_outlined(self, font: pygame.font.Font, text: str, 
+                         fill: tuple, outline: tuple) -> pygame.Surface:
+        """
+        Render text with a 2px diagonal outline baked into one surface
+        
+        Args:
+            font: Font to render with
+            text: Text to render
+            fill: Text color
+            outline: Outline color
+            
+        Returns:
+            Outlined text surface, 4px larger than the plain text (shared - do not modify)
+        """
+        return self._text_cache.get(
+            (font, text, fill, outline),
+            lambda: self._build_outlined(font, text, fill, outline)
+        )
+    
+    def _build_outlined(self, font: pygame.font.Font, text: str, 
+                        fill: tuple, outline: tuple) -> pygame.Surface:
+        """Draw the outlined text surface for _render_outlined"""
+        fill_surface = font.render(text, True, fill)
+        outline_surface = font.render(text, True, outline)
+        width, height = fill_surface.get_size()
+        text_surface = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
+        for x, y in ((0, 0), (0, 4), (4, 0), (4, 4)):
+            text_surface.blit(outline_surface, (x, y))
+        text_surface.blit(fill_surface, (2, 2))
+        return self._to_display_format(text_surface)
+    
+    def _to_display_format(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Convert a surface to the display's pixel format for faster blits
+        
+        Args:
+            surface: Per-pixel alpha surface to convert
+            
+        Returns:
+            Converted surface, or the original if no display mode is set yet
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha()
+    
+    def _compute_stamina_color(self, stamina_percent: float) -> tuple:
+        """
+        Stamina bar color for a given stamina percentage
+        
+        Args:
+            stamina_percent: Stamina percentage (0.0 to 1.0)
+            
+        Returns:
+            Bar color (R, G, B)
+        """
+        if stamina_percent > 0.6:
+            return self.COLOR_STAMINA_FULL
+        elif stamina_percent > 0.3:
+            # Interpolate between green and yellow
+            t = (stamina_percent - 0.3) / 0.3
+            return self._lerp_color(self.COLOR_STAMINA_MED, self.COLOR_STAMINA_FULL, t)
+        else:
+            # Interpolate between red and yellow
+            t = stamina_percent / 0.3
+            return self._lerp_color(self.COLOR_STAMINA_LOW, self.COLOR_STAMINA_MED, t)
+    
     def _lerp_color(self, color1: tuple, color2: tuple, t: float) -> tuple:
         """
         Linear interpolation between two colors
@@ -297,26 +442,102 @@ class CombatHUD:
             surface: Surface to draw on
             player: Player object with stats, weapon, and combat info
         """
+        self._dirty_rects = []
+        exhausted = player.stats.is_exhausted()
+        
+        if exhausted or self.weapon_switch_timer > 0:
+            # Pulse / flash animate every frame - draw straight to the screen
+            self._panel_state = None
+            self._draw_panel(surface, player, exhausted)
+            self._dirty_rects.append(self._panel_rect)
+        else:
+            state = self._get_panel_state(player)
+            if state != self._panel_state:
+                self._panel.fill((0, 0, 0, 0))
+                self._draw_panel(self._panel, player, exhausted)
+                self._panel_state = state
+                self._dirty_rects.append(self._panel_rect)
+            surface.blit(self._panel, (0, 0))
+        
+        # Combo counter (if active and combo > 1)
+        last_combo_rect = self._combo_rect
+        self._combo_rect = None
+        if player.combat.is_attacking and player.combat.combo_count > 1:
+            self.draw_combo_counter(
+                surface,
+                player.combat.combo_count,
+                player.combat.combo_timer,
+                player.combat.combo_window,
+                True
+            )
+        # The combo area changes while shown and on the frame it disappears
+        if last_combo_rect and last_combo_rect != self._combo_rect:
+            self._dirty_rects.append(last_combo_rect)
+        if self._combo_rect:
+            self._dirty_rects.append(self._combo_rect)
+    
+    def get_dirty_rects(self) -> list:
+        """
+        Screen regions changed by the last draw() call
+        
+        Lets a caller that does not redraw the whole screen present only
+        these areas with pygame.display.update(); an empty list means the
+        HUD looks the same as the previous frame.
+        
+        Returns:
+            List of pygame.Rect
+        """
+        return self._dirty_rects
+    
+    def _get_panel_state(self, player) -> tuple:
+        """
+        Everything visible on the stamina + weapon panel
+        
+        Args:
+            player: Player object with stats and weapon info
+            
+        Returns:
+            Tuple that changes whenever the panel would draw differently
+        """
+        stats = player.stats
+        stamina_percent = stats.current_stamina / stats.max_stamina if stats.max_stamina > 0 else 0
+        weapon = player.current_weapon
+        if weapon:
+            weapon_state = (weapon.name, weapon.base_damage, weapon.attack_speed,
+                            weapon.stamina_light, weapon.stamina_heavy)
+        else:
+            weapon_state = None
+        return (
+            int(stats.current_stamina),
+            int(stats.max_stamina),
+            int(self.stamina_bar_width * stamina_percent),
+            min(100, int(stamina_percent * 100)),
+            stats.stamina_regen_delay > 0,
+            weapon_state
+        )
+    
+    def _draw_panel(self, surface: pygame.Surface, player, exhausted: bool):
+        """
+        Draw the stamina bar and weapon indicator
+        
+        Args:
+            surface: Surface to draw on
+            player: Player object with stats and weapon info
+            exhausted: Whether player is exhausted
+        """
         # Stamina bar
         self.draw_stamina_bar(
             surface,
             player.stats.current_stamina,
             player.stats.max_stamina,
             player.stats.stamina_regen_delay,
-            player.stats.is_exhausted()
+            exhausted
         )
         
         # Weapon indicator
         if player.current_weapon:
             weapon = player.current_weapon
-            weapon_hotkeys = {
-                'sword': '1',
-                'dagger': '2',
-                'greatsword': '3',
-                'spear': '4',
-                'hammer': '5'
-            }
-            hotkey = weapon_hotkeys.get(weapon.name.lower(), '?')
+            hotkey = _WEAPON_HOTKEYS.get(weapon.name.lower(), '?')
             
             self.draw_weapon_indicator(
                 surface,
@@ -328,13 +549,3 @@ class CombatHUD:
                 weapon.stamina_light,
                 weapon.stamina_heavy
             )
-        
-        # Combo counter (if active and combo > 1)
-        if player.combat.is_attacking and player.combat.combo_count > 1:
-            self.draw_combo_counter(
-                surface,
-                player.combat.combo_count,
-                player.combat.combo_timer,
-                player.combat.combo_window,
-                True
-            )
@@ -5,6 +5,55 @@ Combines character stats and inventory in a polished fantasy-themed UI
 
 import pygame
 
+from src.core.resources import SurfaceCache, load_font
+
+
+# Tabs: (tab id, label, x offset from panel)
+_TABS = (
+    ("character", "CHARACTER", 40),
+    ("inventory", "INVENTORY", 250)
+)
+
+# Core attributes: (label, PlayerStats attribute, description)
+_ATTRIBUTES = (
+    ("Strength", "strength", "Melee Damage, Max HP, Defense"),
+    ("Dexterity", "dexterity", "Attack Speed, Movement, Critical"),
+    ("Intelligence", "intelligence", "Spell Damage, Max Mana, Regen"),
+    ("Vitality", "vitality", "HP, HP Regen, Resistances")
+)
+
+# Derived stat sections: (header, ((label, PlayerStats attribute, format), ...))
+_STAT_SECTIONS = (
+    ("OFFENSE", (
+        ("Base Damage", "base_damage", "{}"),
+        ("Attack Damage", "attack_damage", "{}"),
+        ("Attack Speed", "attack_speed", "{:.2f}x"),
+        ("Critical Chance", "critical_chance", "{:.1%}"),
+        ("Critical Multiplier", "critical_multiplier", "{:.1f}x"),
+    )),
+    ("DEFENSE", (
+        ("Max Health", "max_health", "{:.0f}"),
+        ("Current Health", "current_health", "{:.0f}"),
+        ("HP Regen/sec", "health_regen", "{:.2f}"),
+        ("Defense", "defense", "{:.1f}"),
+        ("Armor", "armor", "{:.1%}"),
+        ("Dodge Chance", "dodge_chance", "{:.1%}"),
+    )),
+    ("UTILITY", (
+        ("Max Mana", "max_mana", "{:.0f}"),
+        ("Current Mana", "current_mana", "{:.0f}"),
+        ("Mana Regen/sec", "mana_regen", "{:.1f}"),
+        ("Movement Speed", "movement_speed", "{:.2f}x"),
+    ))
+)
+
+# Every PlayerStats value the character tab shows
+_CHARACTER_STAT_KEYS = (
+    ("level", "current_xp", "attribute_points", "skill_points") +
+    tuple(attr_key for _, attr_key, _ in _ATTRIBUTES) +
+    tuple(stat_key for _, section_stats in _STAT_SECTIONS for _, stat_key, _ in section_stats)
+)
+
 
 class EnhancedPlayerMenu:
     """
@@ -63,11 +112,14 @@ class EnhancedPlayerMenu:
         }
         
         # Fonts
-        self.font_title = pygame.font.Font(None, 48)
-        self.font_tab = pygame.font.Font(None, 32)
-        self.font_header = pygame.font.Font(None, 28)
-        self.font_normal = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 20)
+        self.font_title = load_font(None, 48)
+        self.font_tab = load_font(None, 32)
+        self.font_header = load_font(None, 28)
+        self.font_normal = load_font(None, 24)
+        self.font_small = load_font(None, 20)
+        
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache = SurfaceCache(512)
         
         # Inventory UI components
         self.slot_size = 54
@@ -75,6 +127,21 @@ class EnhancedPlayerMenu:
         self.grid_cols = 8
         self.grid_rows = 5
         
+        # Item icons are a fixed size, centered in their slot
+        self._icon_size = self.slot_size - 8
+        self._icon_offset = self.slot_size // 2 - self._icon_size // 2
+        
+        # Hollow 2px item borders keyed by color, one per rarity
+        self._border_stamps = {}
+        for color in self.rarity_colors.values():
+            self._get_border_stamp(color)
+        
+        # Pre-drawn slot backgrounds (fill + border), normal and hovered
+        self._grid_slot_bg = self._build_slot_bg((35, 40, 60), 1)
+        self._grid_slot_bg_hover = self._build_slot_bg((50, 55, 75), 1)
+        self._equipment_slot_bg = self._build_slot_bg((35, 40, 60), 2)
+        self._equipment_slot_bg_hover = self._build_slot_bg((50, 55, 75), 2)
+        
         # Equipment slots layout (relative to content area)
         self.equipment_panel_width = 340
         self.equipment_slots = {
@@ -87,6 +154,37 @@ class EnhancedPlayerMenu:
             "boots": (150, 310)
         }
         
+        # Screen positions of every slot, fixed by the layout above
+        self._grid_start_x = self.content_x + self.equipment_panel_width + 60
+        self._grid_start_y = self.content_y + 80
+        self._slot_step = self.slot_size + self.slot_padding
+        self._grid_slot_xy = [
+            (self._grid_start_x + col * self._slot_step, self._grid_start_y + row * self._slot_step)
+            for row in range(self.grid_rows)
+            for col in range(self.grid_cols)
+        ]
+        equip_base_x = self.content_x + 20
+        equip_base_y = self.content_y + 80
+        self._equipment_slot_xy = {
+            slot_name: (equip_base_x + offset_x, equip_base_y + offset_y)
+            for slot_name, (offset_x, offset_y) in self.equipment_slots.items()
+        }
+        
+        self._grid_slot_blits = [(self._grid_slot_bg, slot_xy) for slot_xy in self._grid_slot_xy]
+        
+        # Hit-test rects; one pixel larger because clicks on the far edge count
+        self._tab_rects = tuple(
+            (tab_id, pygame.Rect(self.panel_x + tab_offset, self.tab_y, 
+                                 self.tab_width + 1, self.tab_height + 1))
+            for tab_id, _, tab_offset in _TABS
+        )
+        # Equipment slots in draw order: (name, x, y, hit-test rect)
+        self._equipment_entries = tuple(
+            (slot_name, slot_x, slot_y, 
+             pygame.Rect(slot_x, slot_y, self.slot_size + 1, self.slot_size + 1))
+            for slot_name, (slot_x, slot_y) in self._equipment_slot_xy.items()
+        )
+        
         # Drag and drop state
         self.dragging = False
         self.dragged_item = None
@@ -99,6 +197,66 @@ class EnhancedPlayerMenu:
         self.hovered_item = None
         self.hovered_slot = None
         self.hovered_type = None
+        
+        # XP thresholds by level for the stats object they came from
+        self._xp_cache = {}
+        self._xp_cache_stats = None
+        
+        # Last tooltip and dragged item surfaces, with the item they show
+        self._tooltip_item = None
+        self._tooltip_surface = None
+        self._tooltip_size = (0, 0)
+        self._drag_surface_item = None
+        self._drag_surface = None
+        
+        # Last formatted label text by tag: (values, text)
+        self._format_cache = {}
+        
+        # Mouse position sampled once per draw(), and where hover was last updated
+        self._frame_mouse_pos = (0, 0)
+        self._last_hover_mouse_pos = None
+        
+        # Darkening overlay and main panel (background, border, corner
+        # accents) never change, so draw them once
+        self._overlay = pygame.Surface((self.screen_width, self.screen_height))
+        self._overlay.fill((0, 0, 0))
+        self._overlay.set_alpha(self.bg_overlay[3])
+        self._panel_surface = self._build_panel_surface()
+        
+        # Everything inside the panel, re-rendered only when what it shows
+        # changes. Screen-sized so the tab drawing code keeps screen coordinates;
+        # created on first draw.
+        self._composite = None
+        self._composite_area = pygame.Rect(
+            self.panel_x, self.panel_y, self.panel_width, self.panel_height
+        ).clip(pygame.Rect(0, 0, self.screen_width, self.screen_height))
+        self._composite_state = None
+    
+    def _build_slot_bg(self, fill_color, border_width):
+        """Pre-draw a slot background with its border"""
+        slot_bg = pygame.Surface((self.slot_size, self.slot_size))
+        slot_bg.fill(fill_color)
+        pygame.draw.rect(slot_bg, self.divider_color, 
+                        (0, 0, self.slot_size, self.slot_size), border_width)
+        return slot_bg
+    
+    def _build_panel_surface(self):
+        """Pre-draw the main panel with its border and corner accents"""
+        panel = pygame.Surface((self.panel_width, self.panel_height))
+        panel.fill(self.panel_bg)
+        pygame.draw.rect(panel, self.panel_border,
+                        (0, 0, self.panel_width, self.panel_height), 3)
+        self.draw_corner_accents(panel, 0, 0)
+        return panel
+    
+    def _get_border_stamp(self, color):
+        """Get a pre-drawn hollow item border in the given color"""
+        stamp = self._border_stamps.get(color)
+        if stamp is None:
+            stamp = pygame.Surface((self.slot_size - 4, self.slot_size - 4), pygame.SRCALPHA)
+            pygame.draw.rect(stamp, color, stamp.get_rect(), 2)
+            self._border_stamps[color] = stamp
+        return stamp
     
     def toggle(self, player_stats, player_inventory):
         """Toggle menu open/closed"""
@@ -136,7 +294,7 @@ class EnhancedPlayerMenu:
             return False
         
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             
             # Check tab clicks
             if self.check_tab_click(mouse_pos):
@@ -148,8 +306,7 @@ class EnhancedPlayerMenu:
         
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self.dragging and self.current_tab == "inventory":
-                mouse_pos = pygame.mouse.get_pos()
-                self.end_drag(mouse_pos)
+                self.end_drag(event.pos)
                 return True
         
         elif event.type == pygame.KEYDOWN:
@@ -174,21 +331,10 @@ class EnhancedPlayerMenu:
     
     def check_tab_click(self, mouse_pos):
         """Check if a tab was clicked"""
-        x, y = mouse_pos
-        
-        # Character tab
-        char_tab_x = self.panel_x + 40
-        if (char_tab_x <= x <= char_tab_x + self.tab_width and
-            self.tab_y <= y <= self.tab_y + self.tab_height):
-            self.switch_tab("character")
-            return True
-        
-        # Inventory tab
-        inv_tab_x = char_tab_x + self.tab_width + 10
-        if (inv_tab_x <= x <= inv_tab_x + self.tab_width and
-            self.tab_y <= y <= self.tab_y + self.tab_height):
-            self.switch_tab("inventory")
-            return True
+        for tab_id, tab_rect in self._tab_rects:
+            if tab_rect.collidepoint(mouse_pos):
+                self.switch_tab(tab_id)
+                return True
         
         return False
     
@@ -269,11 +415,17 @@ class EnhancedPlayerMenu:
     
     def update_hover(self):
         """Update hover state for tooltips"""
+        # Hover can't change while the mouse is still, unless the tab, drag
+        # state or inventory contents changed (draw() resets this when they do)
+        if self._frame_mouse_pos == self._last_hover_mouse_pos:
+            return
+        self._last_hover_mouse_pos = self._frame_mouse_pos
+        
         if self.dragging or self.current_tab != "inventory":
             self.hovered_item = None
             return
         
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._frame_mouse_pos
         
         grid_slot = self.get_inventory_slot_at_pos(mouse_pos)
         if grid_slot is not None:
@@ -302,82 +454,83 @@ class EnhancedPlayerMenu:
         if self.current_tab != "inventory":
             return None
         
-        x, y = pos
-        grid_start_x = self.content_x + self.equipment_panel_width + 60
-        grid_start_y = self.content_y + 80
+        # Uniform grid - find the cell arithmetically, then reject the padding
+        dx = pos[0] - self._grid_start_x
+        dy = pos[1] - self._grid_start_y
+        if dx < 0 or dy < 0:
+            return None
         
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                slot_index = row * self.grid_cols + col
-                slot_x = grid_start_x + col * (self.slot_size + self.slot_padding)
-                slot_y = grid_start_y + row * (self.slot_size + self.slot_padding)
-                
-                if (slot_x <= x <= slot_x + self.slot_size and
-                    slot_y <= y <= slot_y + self.slot_size):
-                    return slot_index
+        col, offset_x = divmod(dx, self._slot_step)
+        row, offset_y = divmod(dy, self._slot_step)
+        if (col >= self.grid_cols or row >= self.grid_rows or
+            offset_x > self.slot_size or offset_y > self.slot_size):
+            return None
         
-        return None
+        return row * self.grid_cols + col
     
     def get_equipment_slot_at_pos(self, pos):
         """Get equipment slot at mouse position"""
         if self.current_tab != "inventory":
             return None
         
-        x, y = pos
-        equip_base_x = self.content_x + 20
-        equip_base_y = self.content_y + 80
-        
-        for slot_name, (offset_x, offset_y) in self.equipment_slots.items():
-            slot_x = equip_base_x + offset_x
-            slot_y = equip_base_y + offset_y
-            
-            if (slot_x <= x <= slot_x + self.slot_size and
-                slot_y <= y <= slot_y + self.slot_size):
+        for slot_name, _, _, slot_rect in self._equipment_entries:
+            if slot_rect.collidepoint(pos):
                 return slot_name
         
         return None
     
     def get_grid_slot_position(self, slot_index):
         """Get screen position of inventory grid slot"""
-        grid_start_x = self.content_x + self.equipment_panel_width + 60
-        grid_start_y = self.content_y + 80
-        
-        row = slot_index // self.grid_cols
-        col = slot_index % self.grid_cols
-        x = grid_start_x + col * (self.slot_size + self.slot_padding)
-        y = grid_start_y + row * (self.slot_size + self.slot_padding)
-        return x, y
+        return self._grid_slot_xy[slot_index]
     
     def get_equipment_slot_position(self, slot_name):
         """Get screen position of equipment slot"""
-        equip_base_x = self.content_x + 20
-        equip_base_y = self.content_y + 80
-        
-        offset_x, offset_y = self.equipment_slots[slot_name]
-        return equip_base_x + offset_x, equip_base_y + offset_y
+        return self._equipment_slot_xy[slot_name]
+    
+    def _render_cached(self, font, text, color):
+        """Render text, reusing the surface from a previous identical render"""
+        return self._text_cache.render(font, text, color)
     
     def draw(self, screen):
         """Draw the enhanced player menu"""
         if not self.is_open:
             return
         
+        # Panel contents changed (inventory, tab, drag) - re-render and re-check hover
+        state = self._get_composite_state()
+        if self._composite is None:
+            self._composite = pygame.Surface((self.screen_width, self.screen_height))
+        if state != self._composite_state:
+            self.draw_panel_contents(self._composite)
+            self._composite_state = state
+            self._last_hover_mouse_pos = None
+        
         # Update hover state
+        self._frame_mouse_pos = pygame.mouse.get_pos()
         self.update_hover()
         
         # Draw overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(self.bg_overlay[3])
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
+        
+        # Draw panel, tabs, tab content and controls hint
+        screen.blit(self._composite, self._composite_area.topleft, self._composite_area)
         
-        # Draw main panel
-        pygame.draw.rect(screen, self.panel_bg,
-                        (self.panel_x, self.panel_y, self.panel_width, self.panel_height))
-        pygame.draw.rect(screen, self.panel_border,
-                        (self.panel_x, self.panel_y, self.panel_width, self.panel_height), 3)
+        # Draw hovered slot highlight over the composite
+        if self.hovered_item and not self.dragging:
+            self.draw_hover_highlight(screen)
         
-        # Draw decorative corner accents
-        self.draw_corner_accents(screen)
+        # Draw tooltip (always on top)
+        if self.hovered_item and not self.dragging:
+            self.draw_tooltip(screen)
+        
+        # Draw dragged item (top layer)
+        if self.dragging and self.dragged_item:
+            self.draw_dragged_item(screen)
+    
+    def draw_panel_contents(self, screen):
+        """Draw the main panel, tabs, active tab content and controls hint"""
+        # Draw main panel (with decorative corner accents)
+        screen.blit(self._panel_surface, (self.panel_x, self.panel_y))
         
         # Draw tabs
         self.draw_tabs(screen)
@@ -388,51 +541,56 @@ class EnhancedPlayerMenu:
         elif self.current_tab == "inventory":
             self.draw_inventory_tab(screen)
         
-        # Draw tooltip (always on top)
-        if self.hovered_item and not self.dragging:
-            self.draw_tooltip(screen)
-        
-        # Draw dragged item (top layer)
-        if self.dragging and self.dragged_item:
-            self.draw_dragged_item(screen)
-        
         # Draw controls hint
         self.draw_controls_hint(screen)
     
-    def draw_corner_accents(self, screen):
+    def _get_composite_state(self):
+        """Tuple that changes whenever draw_panel_contents would draw differently"""
+        content = None
+        if self.current_tab == "character":
+            stats = self.player_stats
+            if stats:
+                content = (stats,) + tuple(getattr(stats, key) for key in _CHARACTER_STAT_KEYS)
+        elif self.current_tab == "inventory":
+            inventory = self.player_inventory
+            if inventory:
+                items = inventory.grid + list(inventory.equipment.values())
+                content = (
+                    inventory, inventory.gold, tuple(items),
+                    tuple(item.stack_count for item in items if item),
+                    self.dragging, self.drag_source_type, self.drag_source_slot
+                )
+        return (self.current_tab, content)
+    
+    def draw_corner_accents(self, screen, panel_x=None, panel_y=None):
         """Draw decorative corner accents for fantasy feel"""
+        if panel_x is None:
+            panel_x = self.panel_x
+        if panel_y is None:
+            panel_y = self.panel_y
         accent_size = 30
         accent_color = self.accent_cyan
         
+        # Corner position and the direction the accent points into the panel
         corners = [
-            (self.panel_x, self.panel_y),
-            (self.panel_x + self.panel_width, self.panel_y),
-            (self.panel_x, self.panel_y + self.panel_height),
-            (self.panel_x + self.panel_width, self.panel_y + self.panel_height)
+            (panel_x, panel_y, 1, 1),                                          # Top-left
+            (panel_x + self.panel_width, panel_y, -1, 1),                      # Top-right
+            (panel_x, panel_y + self.panel_height, 1, -1),                     # Bottom-left
+            (panel_x + self.panel_width, panel_y + self.panel_height, -1, -1)  # Bottom-right
         ]
         
-        for i, (cx, cy) in enumerate(corners):
-            if i == 0:  # Top-left
-                pygame.draw.line(screen, accent_color, (cx + 5, cy + 5), (cx + accent_size, cy + 5), 2)
-                pygame.draw.line(screen, accent_color, (cx + 5, cy + 5), (cx + 5, cy + accent_size), 2)
-            elif i == 1:  # Top-right
-                pygame.draw.line(screen, accent_color, (cx - 5, cy + 5), (cx - accent_size, cy + 5), 2)
-                pygame.draw.line(screen, accent_color, (cx - 5, cy + 5), (cx - 5, cy + accent_size), 2)
-            elif i == 2:  # Bottom-left
-                pygame.draw.line(screen, accent_color, (cx + 5, cy - 5), (cx + accent_size, cy - 5), 2)
-                pygame.draw.line(screen, accent_color, (cx + 5, cy - 5), (cx + 5, cy - accent_size), 2)
-            elif i == 3:  # Bottom-right
-                pygame.draw.line(screen, accent_color, (cx - 5, cy - 5), (cx - accent_size, cy - 5), 2)
-                pygame.draw.line(screen, accent_color, (cx - 5, cy - 5), (cx - 5, cy - accent_size), 2)
+        for cx, cy, dx, dy in corners:
+            # One L-shaped polyline per corner
+            pygame.draw.lines(screen, accent_color, False, [
+                (cx + dx * accent_size, cy + dy * 5),
+                (cx + dx * 5, cy + dy * 5),
+                (cx + dx * 5, cy + dy * accent_size)
+            ], 2)
     
     def draw_tabs(self, screen):
         """Draw tab navigation"""
-        tabs = [
-            ("character", "CHARACTER", self.panel_x + 40),
-            ("inventory", "INVENTORY", self.panel_x + 250)
-        ]
-        
-        for tab_id, tab_label, tab_x in tabs:
+        for tab_id, tab_label, tab_offset in _TABS:
+            tab_x = self.panel_x + tab_offset
             is_active = (tab_id == self.current_tab)
             
             # Tab background
@@ -448,7 +606,7 @@ class EnhancedPlayerMenu:
             
             # Tab text
             text_color = self.text_header if is_active else self.text_secondary
-            text = self.font_tab.render(tab_label, True, text_color)
+            text = self._render_cached(self.font_tab, tab_label, text_color)
             text_rect = text.get_rect(center=(tab_x + self.tab_width // 2, self.tab_y + self.tab_height // 2))
             screen.blit(text, text_rect)
             
@@ -466,7 +624,7 @@ class EnhancedPlayerMenu:
         stats = self.player_stats
         
         # Title
-        title = self.font_title.render("CHARACTER", True, self.text_header)
+        title = self._render_cached(self.font_title, "CHARACTER", self.text_header)
         screen.blit(title, (self.content_x, self.content_y))
         
         # Divider
@@ -483,128 +641,110 @@ class EnhancedPlayerMenu:
         y = start_y
         
         # Level and XP
-        level_text = self.font_header.render(f"LEVEL {stats.level}", True, self.gold_color)
+        level_label = self._format_cached("level", "LEVEL {}", stats.level)
+        level_text = self._render_cached(self.font_header, level_label, self.gold_color)
         screen.blit(level_text, (col1_x, y))
         y += 40
         
         # XP Bar
         xp_bar_width = 400
         xp_bar_height = 25
-        xp_needed = stats.calculate_xp_for_level(stats.level + 1) - stats.calculate_xp_for_level(stats.level)
-        xp_progress = stats.current_xp - stats.calculate_xp_for_level(stats.level)
+        xp_level_start = self._xp_for_level(stats, stats.level)
+        xp_needed = self._xp_for_level(stats, stats.level + 1) - xp_level_start
+        xp_progress = stats.current_xp - xp_level_start
         xp_percent = min(1.0, xp_progress / xp_needed if xp_needed > 0 else 0)
         
         pygame.draw.rect(screen, (30, 35, 50), (col1_x, y, xp_bar_width, xp_bar_height))
         pygame.draw.rect(screen, self.accent_cyan, (col1_x, y, int(xp_bar_width * xp_percent), xp_bar_height))
         pygame.draw.rect(screen, self.divider_color, (col1_x, y, xp_bar_width, xp_bar_height), 2)
         
-        xp_text = self.font_small.render(f"{xp_progress} / {xp_needed} XP", True, self.text_primary)
+        xp_label = self._format_cached("xp", "{} / {} XP", xp_progress, xp_needed)
+        xp_text = self._render_cached(self.font_small, xp_label, self.text_primary)
         xp_text_rect = xp_text.get_rect(center=(col1_x + xp_bar_width // 2, y + xp_bar_height // 2))
         screen.blit(xp_text, xp_text_rect)
         y += 50
         
         # Available Points
         if stats.attribute_points > 0:
-            points_text = self.font_normal.render(f"Attribute Points: {stats.attribute_points}", True, self.stat_positive)
+            points_label = self._format_cached("attribute_points", "Attribute Points: {}", 
+                                               stats.attribute_points)
+            points_text = self._render_cached(self.font_normal, points_label, self.stat_positive)
             screen.blit(points_text, (col1_x, y))
             y += 30
         
         if stats.skill_points > 0:
-            skill_text = self.font_normal.render(f"Skill Points: {stats.skill_points}", True, self.stat_positive)
+            skill_label = self._format_cached("skill_points", "Skill Points: {}", stats.skill_points)
+            skill_text = self._render_cached(self.font_normal, skill_label, self.stat_positive)
             screen.blit(skill_text, (col1_x, y))
             y += 30
         
         y += 20
         
         # CORE ATTRIBUTES
-        attr_header = self.font_header.render("CORE ATTRIBUTES", True, self.text_header)
+        attr_header = self._render_cached(self.font_header, "CORE ATTRIBUTES", self.text_header)
         screen.blit(attr_header, (col1_x, y))
         y += 40
         
-        attributes = [
-            ("Strength", stats.strength, "Melee Damage, Max HP, Defense"),
-            ("Dexterity", stats.dexterity, "Attack Speed, Movement, Critical"),
-            ("Intelligence", stats.intelligence, "Spell Damage, Max Mana, Regen"),
-            ("Vitality", stats.vitality, "HP, HP Regen, Resistances")
-        ]
-        
-        for attr_name, attr_value, attr_desc in attributes:
+        for attr_name, attr_key, attr_desc in _ATTRIBUTES:
+            attr_value = getattr(stats, attr_key)
+            
             # Attribute name and value (aligned)
-            name_text = self.font_normal.render(f"{attr_name}:", True, self.text_secondary)
+            name_text = self._render_cached(self.font_normal, f"{attr_name}:", self.text_secondary)
             screen.blit(name_text, (col1_x, y))
             
-            value_text = self.font_normal.render(str(attr_value), True, self.text_primary)
+            value_label = self._format_cached(attr_key, "{}", attr_value)
+            value_text = self._render_cached(self.font_normal, value_label, self.text_primary)
             screen.blit(value_text, (col1_x + 180, y))
             
             # Description
-            desc_text = self.font_small.render(attr_desc, True, self.text_secondary)
+            desc_text = self._render_cached(self.font_small, attr_desc, self.text_secondary)
             screen.blit(desc_text, (col1_x + 20, y + 25))
             y += 60
         
         # RIGHT COLUMN - Derived Stats
         y = start_y
         
-        # Offense header
-        offense_header = self.font_header.render("OFFENSE", True, self.text_header)
-        screen.blit(offense_header, (col2_x, y))
-        y += 40
-        
-        offense_stats = [
-            ("Base Damage", f"{stats.base_damage}"),
-            ("Attack Damage", f"{stats.attack_damage}"),
-            ("Attack Speed", f"{stats.attack_speed:.2f}x"),
-            ("Critical Chance", f"{stats.critical_chance * 100:.1f}%"),
-            ("Critical Multiplier", f"{stats.critical_multiplier:.1f}x"),
-        ]
-        
-        for stat_name, stat_value in offense_stats:
-            self.draw_aligned_stat(screen, col2_x, y, stat_name, stat_value)
-            y += 30
-        
-        y += 20
-        
-        # Defense header
-        defense_header = self.font_header.render("DEFENSE", True, self.text_header)
-        screen.blit(defense_header, (col2_x, y))
-        y += 40
-        
-        defense_stats = [
-            ("Max Health", f"{stats.max_health:.0f}"),
-            ("Current Health", f"{stats.current_health:.0f}"),
-            ("HP Regen/sec", f"{stats.health_regen:.2f}"),
-            ("Defense", f"{stats.defense:.1f}"),
-            ("Armor", f"{stats.armor * 100:.1f}%"),
-            ("Dodge Chance", f"{stats.dodge_chance * 100:.1f}%"),
-        ]
-        
-        for stat_name, stat_value in defense_stats:
-            self.draw_aligned_stat(screen, col2_x, y, stat_name, stat_value)
-            y += 30
-        
-        y += 20
-        
-        # Utility header
-        utility_header = self.font_header.render("UTILITY", True, self.text_header)
-        screen.blit(utility_header, (col2_x, y))
-        y += 40
-        
-        utility_stats = [
-            ("Max Mana", f"{stats.max_mana:.0f}"),
-            ("Current Mana", f"{stats.current_mana:.0f}"),
-            ("Mana Regen/sec", f"{stats.mana_regen:.1f}"),
-            ("Movement Speed", f"{stats.movement_speed:.2f}x"),
-        ]
-        
-        for stat_name, stat_value in utility_stats:
-            self.draw_aligned_stat(screen, col2_x, y, stat_name, stat_value)
-            y += 30
+        for section_header, section_stats in _STAT_SECTIONS:
+            # Section header
+            header = self._render_cached(self.font_header, section_header, self.text_header)
+            screen.blit(header, (col2_x, y))
+            y += 40
+            
+            for stat_name, stat_key, stat_format in section_stats:
+                stat_value = self._format_cached(stat_key, stat_format, getattr(stats, stat_key))
+                self.draw_aligned_stat(screen, col2_x, y, stat_name, stat_value)
+                y += 30
+            
+            y += 20
+    
+    def _format_cached(self, tag, fmt, *values):
+        """Format a label, reusing the last string for this tag if its values are unchanged"""
+        cached = self._format_cache.get(tag)
+        if cached is not None and cached[0] == values:
+            return cached[1]
+        text = fmt.format(*values)
+        self._format_cache[tag] = (values, text)
+        return text
+    
+    def _xp_for_level(self, stats, level):
+        """Get total XP required for a level, computed once per level"""
+        if stats is not self._xp_cache_stats:
+            # Different player stats (set directly or via toggle/open_to_tab)
+            self._xp_cache.clear()
+            self._xp_cache_stats = stats
+        
+        xp = self._xp_cache.get(level)
+        if xp is None:
+            xp = stats.calculate_xp_for_level(level)
+            self._xp_cache[level] = xp
+        return xp
     
     def draw_aligned_stat(self, screen, x, y, name, value):
         """Draw perfectly aligned stat line"""
-        name_text = self.font_normal.render(f"{name}:", True, self.text_secondary)
+        name_text = self._render_cached(self.font_normal, f"{name}:", self.text_secondary)
         screen.blit(name_text, (x, y))
         
-        value_text = self.font_normal.render(value, True, self.text_primary)
+        value_text = self._render_cached(self.font_normal, value, self.text_primary)
         screen.blit(value_text, (x + 280, y))
     
     def draw_inventory_tab(self, screen):
@@ -613,10 +753,11 @@ class EnhancedPlayerMenu:
             return
         
         # Title and gold
-        title = self.font_title.render("INVENTORY", True, self.text_header)
+        title = self._render_cached(self.font_title, "INVENTORY", self.text_header)
         screen.blit(title, (self.content_x, self.content_y))
         
-        gold_text = self.font_header.render(f"{self.player_inventory.gold} Gold", True, self.gold_color)
+        gold_label = self._format_cached("gold", "{} Gold", self.player_inventory.gold)
+        gold_text = self._render_cached(self.font_header, gold_label, self.gold_color)
         screen.blit(gold_text, (self.content_x + self.content_width - 200, self.content_y))
         
         # Divider
@@ -642,33 +783,23 @@ class EnhancedPlayerMenu:
         pygame.draw.rect(screen, self.divider_color, panel_rect, 2)
         
         # Header
-        header = self.font_header.render("EQUIPMENT", True, self.text_header)
+        header = self._render_cached(self.font_header, "EQUIPMENT", self.text_header)
         screen.blit(header, (equip_x, equip_y - 40))
         
         # Draw each equipment slot
-        for slot_name, (offset_x, offset_y) in self.equipment_slots.items():
-            slot_x = equip_x + offset_x
-            slot_y = equip_y + offset_y
-            
-            is_hovered = (self.hovered_type == "equipment" and 
-                         self.hovered_slot == slot_name and 
-                         not self.dragging)
-            
-            # Slot background
-            slot_color = (50, 55, 75) if is_hovered else (35, 40, 60)
-            pygame.draw.rect(screen, slot_color, 
-                           (slot_x, slot_y, self.slot_size, self.slot_size))
-            pygame.draw.rect(screen, self.divider_color, 
-                           (slot_x, slot_y, self.slot_size, self.slot_size), 2)
+        equipment = self.player_inventory.equipment
+        for slot_name, slot_x, slot_y, _ in self._equipment_entries:
+            # Slot background (hover highlight is drawn per frame on top)
+            screen.blit(self._equipment_slot_bg, (slot_x, slot_y))
             
             # Slot label
-            label = self.font_small.render(slot_name.upper(), True, self.text_secondary)
+            label = self._render_cached(self.font_small, slot_name.upper(), self.text_secondary)
             label_rect = label.get_rect(centerx=slot_x + self.slot_size // 2, 
                                         y=slot_y + self.slot_size + 5)
             screen.blit(label, label_rect)
             
             # Draw equipped item
-            item = self.player_inventory.get_equipped_item(slot_name)
+            item = equipment.get(slot_name)
             if item and not (self.dragging and self.drag_source_type == "equipment" 
                            and self.drag_source_slot == slot_name):
                 self.draw_item_in_slot(screen, item, slot_x, slot_y)
@@ -688,50 +819,49 @@ class EnhancedPlayerMenu:
         pygame.draw.rect(screen, self.divider_color, grid_rect, 2)
         
         # Header
-        empty_slots = self.player_inventory.get_empty_slots()
-        header = self.font_header.render(f"STORAGE ({empty_slots}/{self.player_inventory.grid_size} free)", 
-                                        True, self.text_header)
+        grid = self.player_inventory.grid
+        empty_slots = grid.count(None)
+        header_label = self._format_cached("storage", "STORAGE ({}/{} free)", 
+                                           empty_slots, self.player_inventory.grid_size)
+        header = self._render_cached(self.font_header, header_label, self.text_header)
         screen.blit(header, (grid_x, grid_y - 40))
         
-        # Draw slots
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                slot_index = row * self.grid_cols + col
-                slot_x = grid_x + col * (self.slot_size + self.slot_padding)
-                slot_y = grid_y + row * (self.slot_size + self.slot_padding)
-                
-                is_hovered = (self.hovered_type == "inventory" and 
-                            self.hovered_slot == slot_index and 
-                            not self.dragging)
-                
-                # Slot background
-                slot_color = (50, 55, 75) if is_hovered else (35, 40, 60)
-                pygame.draw.rect(screen, slot_color,
-                               (slot_x, slot_y, self.slot_size, self.slot_size))
-                pygame.draw.rect(screen, self.divider_color,
-                               (slot_x, slot_y, self.slot_size, self.slot_size), 1)
-                
-                # Draw item
-                item = self.player_inventory.get_item_at_slot(slot_index)
-                if item and not (self.dragging and self.drag_source_type == "inventory" 
-                               and self.drag_source_slot == slot_index):
-                    self.draw_item_in_slot(screen, item, slot_x, slot_y)
+        # Slot backgrounds, batched into one call (slots never overlap);
+        # hover highlight is drawn per frame on top
+        screen.blits(self._grid_slot_blits, doreturn=False)
+        
+        # Draw items
+        for slot_index, (item, (slot_x, slot_y)) in enumerate(zip(grid, self._grid_slot_xy)):
+            if item and not (self.dragging and self.drag_source_type == "inventory" 
+                           and self.drag_source_slot == slot_index):
+                self.draw_item_in_slot(screen, item, slot_x, slot_y)
+    
+    def draw_hover_highlight(self, screen):
+        """Redraw the hovered slot with its highlight background and item"""
+        if self.hovered_type == "inventory":
+            slot_x, slot_y = self._grid_slot_xy[self.hovered_slot]
+            screen.blit(self._grid_slot_bg_hover, (slot_x, slot_y))
+        elif self.hovered_type == "equipment":
+            # Later equipment slots are drawn over the label above them, so
+            # redrawing this slot on top matches the full draw order
+            slot_x, slot_y = self._equipment_slot_xy[self.hovered_slot]
+            screen.blit(self._equipment_slot_bg_hover, (slot_x, slot_y))
+        else:
+            return
+        self.draw_item_in_slot(screen, self.hovered_item, slot_x, slot_y)
     
     def draw_item_in_slot(self, screen, item, x, y):
         """Draw item icon in slot"""
-        # Draw actual item icon using its visual generation
-        icon_size = self.slot_size - 8
-        icon = item.generate_icon(icon_size)
-        icon_rect = icon.get_rect(center=(x + self.slot_size // 2, y + self.slot_size // 2))
-        screen.blit(icon, icon_rect)
+        # Draw actual item icon using its visual generation (memoized per item)
+        icon = item.generate_icon(self._icon_size)
+        screen.blit(icon, (x + self._icon_offset, y + self._icon_offset))
         
         # Border with rarity color
-        border_rect = pygame.Rect(x + 2, y + 2, self.slot_size - 4, self.slot_size - 4)
-        pygame.draw.rect(screen, item.icon_color, border_rect, 2)
+        screen.blit(self._get_border_stamp(item.icon_color), (x + 2, y + 2))
         
         # Stack count
         if item.stackable and item.stack_count > 1:
-            count_text = self.font_small.render(str(item.stack_count), True, (255, 255, 255))
+            count_text = self._render_cached(self.font_small, str(item.stack_count), (255, 255, 255))
             count_bg = pygame.Rect(x + 4, y + self.slot_size - 18, 
                                   count_text.get_width() + 4, count_text.get_height() + 2)
             pygame.draw.rect(screen, (0, 0, 0, 180), count_bg)
@@ -739,57 +869,86 @@ class EnhancedPlayerMenu:
     
     def draw_dragged_item(self, screen):
         """Draw item being dragged"""
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = self._frame_mouse_pos
         item_x = mouse_x - self.drag_offset_x
         item_y = mouse_y - self.drag_offset_y
         
-        # Draw item icon
-        icon = self.dragged_item.generate_icon(self.slot_size - 8)
-        drag_surface = pygame.Surface((self.slot_size, self.slot_size), pygame.SRCALPHA)
-        icon_rect = icon.get_rect(center=(self.slot_size // 2, self.slot_size // 2))
-        drag_surface.blit(icon, icon_rect)
-        
-        # Border
-        pygame.draw.rect(drag_surface, self.dragged_item.icon_color,
-                        (0, 0, self.slot_size, self.slot_size), 2)
-        
-        # Make semi-transparent
-        drag_surface.set_alpha(200)
-        screen.blit(drag_surface, (item_x, item_y))
+        # Draw item icon (semi-transparent, built once per dragged item)
+        if self.dragged_item is not self._drag_surface_item:
+            self._drag_surface = self._build_drag_surface(self.dragged_item)
+            self._drag_surface_item = self.dragged_item
+        screen.blit(self._drag_surface, (item_x, item_y))
         
         abbrev = self.dragged_item.name[:3].upper()
-        text = self.font_normal.render(abbrev, True, (255, 255, 255))
+        text = self._render_cached(self.font_normal, abbrev, (255, 255, 255))
         text_rect = text.get_rect(center=(item_x + self.slot_size // 2, 
                                           item_y + self.slot_size // 2 - 5))
         screen.blit(text, text_rect)
         
         if self.dragged_item.stackable and self.dragged_item.stack_count > 1:
-            count_text = self.font_small.render(str(self.dragged_item.stack_count), 
-                                              True, (255, 255, 255))
+            count_text = self._render_cached(self.font_small, str(self.dragged_item.stack_count), 
+                                             (255, 255, 255))
             screen.blit(count_text, (item_x + 6, item_y + self.slot_size - 18))
     
+    def _build_drag_surface(self, item):
+        """Pre-draw a dragged item's icon and border at drag transparency"""
+        drag_surface = pygame.Surface((self.slot_size, self.slot_size), pygame.SRCALPHA)
+        drag_surface.blit(item.generate_icon(self._icon_size), (self._icon_offset, self._icon_offset))
+        
+        # Border
+        pygame.draw.rect(drag_surface, item.icon_color,
+                        (0, 0, self.slot_size, self.slot_size), 2)
+        
+        # Make semi-transparent
+        drag_surface.set_alpha(200)
+        return drag_surface
+    
     def draw_tooltip(self, screen):
         """Draw item tooltip"""
         if not self.hovered_item:
             return
         
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        # Tooltip is built once per hovered item
+        if self.hovered_item is not self._tooltip_item:
+            self._tooltip_surface, self._tooltip_size = self._build_tooltip(self.hovered_item)
+            self._tooltip_item = self.hovered_item
+        tooltip_width, tooltip_height = self._tooltip_size
+        
+        mouse_x, mouse_y = self._frame_mouse_pos
+        
+        # Position
+        tooltip_x = mouse_x + 15
+        tooltip_y = mouse_y + 15
+        
+        if tooltip_x + tooltip_width > self.screen_width:
+            tooltip_x = mouse_x - tooltip_width - 15
+        if tooltip_y + tooltip_height > self.screen_height:
+            tooltip_y = mouse_y - tooltip_height - 15
         
+        screen.blit(self._tooltip_surface, (tooltip_x, tooltip_y))
+    
+    def _build_tooltip(self, item):
+        """
+        Pre-draw an item tooltip
+        
+        Returns (surface, (width, height)); the surface may be wider than the
+        tooltip box when the name overhangs it in the larger header font.
+        """
         # Build tooltip lines
         lines = [
-            self.hovered_item.name,
-            f"[{self.hovered_item.rarity}] {self.hovered_item.item_type.capitalize()}",
+            item.name,
+            f"[{item.rarity}] {item.item_type.capitalize()}",
             ""
         ]
         
-        if self.hovered_item.stats:
-            for stat, value in self.hovered_item.stats.items():
+        if item.stats:
+            for stat, value in item.stats.items():
                 prefix = "+" if value > 0 else ""
                 lines.append(f"{prefix}{value} {stat.replace('_', ' ').capitalize()}")
             lines.append("")
         
-        if self.hovered_item.description:
-            lines.append(self.hovered_item.description)
+        if item.description:
+            lines.append(item.description)
         
         # Calculate size
         line_height = 24
@@ -798,40 +957,42 @@ class EnhancedPlayerMenu:
         tooltip_width = max_width + padding * 2
         tooltip_height = len(lines) * line_height + padding * 2
         
-        # Position
-        tooltip_x = mouse_x + 15
-        tooltip_y = mouse_y + 15
+        # Render text
+        texts = []
+        for i, line in enumerate(lines):
+            if i == 0:  # Item name
+                text = self._render_cached(self.font_header, line, item.icon_color)
+            elif i == 1:  # Type/rarity
+                text = self._render_cached(self.font_small, line, self.text_secondary)
+            elif line and line[0] in ['+', '-']:  # Stats
+                text = self._render_cached(self.font_normal, line, self.stat_positive)
+            else:  # Description
+                text = self._render_cached(self.font_small, line, self.text_secondary)
+            texts.append(text)
         
-        if tooltip_x + tooltip_width > self.screen_width:
-            tooltip_x = mouse_x - tooltip_width - 15
-        if tooltip_y + tooltip_height > self.screen_height:
-            tooltip_y = mouse_y - tooltip_height - 15
+        surface_width = max(tooltip_width, padding + max(text.get_width() for text in texts))
+        surface_height = max(tooltip_height, 
+                             padding + (len(texts) - 1) * line_height + texts[-1].get_height())
+        tooltip = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
         
         # Draw background
-        pygame.draw.rect(screen, (20, 22, 35),
-                        (tooltip_x, tooltip_y, tooltip_width, tooltip_height))
-        pygame.draw.rect(screen, self.hovered_item.icon_color,
-                        (tooltip_x, tooltip_y, tooltip_width, tooltip_height), 2)
+        pygame.draw.rect(tooltip, (20, 22, 35),
+                        (0, 0, tooltip_width, tooltip_height))
+        pygame.draw.rect(tooltip, item.icon_color,
+                        (0, 0, tooltip_width, tooltip_height), 2)
         
         # Draw text
         y_offset = padding
-        for i, line in enumerate(lines):
-            if i == 0:  # Item name
-                text = self.font_header.render(line, True, self.hovered_item.icon_color)
-            elif i == 1:  # Type/rarity
-                text = self.font_small.render(line, True, self.text_secondary)
-            elif line and line[0] in ['+', '-']:  # Stats
-                text = self.font_normal.render(line, True, self.stat_positive)
-            else:  # Description
-                text = self.font_small.render(line, True, self.text_secondary)
-            
-            screen.blit(text, (tooltip_x + padding, tooltip_y + y_offset))
+        for text in texts:
+            tooltip.blit(text, (padding, y_offset))
             y_offset += line_height
+        
+        return tooltip, (tooltip_width, tooltip_height)
     
     def draw_controls_hint(self, screen):
         """Draw control hints at bottom"""
         hints = "TAB/ESC: Close  |  1: Character  |  2: Inventory  |  Drag items to equip/move"
-        hint_text = self.font_small.render(hints, True, self.text_secondary)
+        hint_text = self._render_cached(self.font_small, hints, self.text_secondary)
         hint_rect = hint_text.get_rect(center=(self.panel_x + self.panel_width // 2, 
                                                self.panel_y + self.panel_height - 20))
         screen.blit(hint_text, hint_rect)
@@ -5,6 +5,17 @@ Displays when player levels up, allows attribute point allocation
 
 import pygame
 
+from src.core.resources import SurfaceCache
+
+
+# Attributes: (label, PlayerStats attribute, description)
+_ATTRIBUTES = (
+    ('Strength', 'strength', "Melee damage, HP, carry weight"),
+    ('Dexterity', 'dexterity', "Attack speed, dodge, accuracy"),
+    ('Intelligence', 'intelligence', "Magic damage, mana, resistances"),
+    ('Vitality', 'vitality', "Max health, health regen, defense")
+)
+
 
 class LevelUpUI:
     """
@@ -44,6 +55,9 @@ class LevelUpUI:
             self.stat_font = pygame.font.SysFont('arial', 28)
             self.small_font = pygame.font.SysFont('arial', 22)
         
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache = SurfaceCache(256)
+        
         # Buttons for each attribute
         self.attribute_buttons = {}
         button_width = 40
@@ -51,32 +65,58 @@ class LevelUpUI:
         start_y = self.panel_y + 180
         spacing = 70
         
-        attributes = ['strength', 'dexterity', 'intelligence', 'vitality']
-        for i, attr in enumerate(attributes):
+        for i, (_, attr, _) in enumerate(_ATTRIBUTES):
             button_x = self.panel_x + self.panel_width - 100
             button_y = start_y + (i * spacing)
+            rect = pygame.Rect(button_x, button_y, button_width, button_height)
             self.attribute_buttons[attr] = {
-                'rect': pygame.Rect(button_x, button_y, button_width, button_height),
+                'rect': rect,
+                'local_rect': rect.move(-self.panel_x, -self.panel_y),  # Relative to panel
                 'hovered': False
             }
         
         # Close button
+        close_rect = pygame.Rect(self.panel_x + self.panel_width - 100, 
+                                 self.panel_y + self.panel_height - 60, 80, 40)
         self.close_button = {
-            'rect': pygame.Rect(self.panel_x + self.panel_width - 100, 
-                              self.panel_y + self.panel_height - 60, 80, 40),
+            'rect': close_rect,
+            'local_rect': close_rect.move(-self.panel_x, -self.panel_y),  # Relative to panel
             'hovered': False,
             'text': 'Close'
         }
         
+        # Hit-test table: attribute buttons in order, then the close button
+        self._attribute_keys = tuple(self.attribute_buttons)
+        self._hover_buttons = tuple(self.attribute_buttons.values()) + (self.close_button,)
+        self._hover_rects = [button['rect'] for button in self._hover_buttons]
+        self._hover_index = -1
+        
         # Animation
         self.animation_timer = 0
         self.particle_effects = []
+        # Burst particle images keyed by remaining life (size and fade
+        # depend only on life, and every particle is gold)
+        self._particle_surfaces = {}
+        
+        # Darkening overlay (solid black with surface alpha)
+        self._overlay = pygame.Surface((screen_width, screen_height))
+        self._overlay.fill((0, 0, 0))
+        self._overlay.set_alpha(180)
+        
+        # Panel background, title and attribute labels, drawn on first open
+        self._static_panel = None
+        # Static panel plus the values and buttons for _panel_state
+        self._panel = None
+        self._panel_state = None
     
     def open(self, player_stats):
         """Open the level-up UI with player stats"""
         self.is_open = True
         self.player_stats = player_stats
         self.animation_timer = 0
+        if self._static_panel is None:
+            self._static_panel = self._build_static_panel()
+        self._panel_state = None
         self.create_level_up_particles()
     
     def close(self):
@@ -86,19 +126,20 @@ class LevelUpUI:
     
     def create_level_up_particles(self):
         """Create particle burst effect for level-up"""
+        import math
         import random
         self.particle_effects = []
         center_x = self.screen_width // 2
         center_y = self.screen_height // 2
         
         for _ in range(30):
-            angle = random.uniform(0, 360)
+            angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(2, 6)
             self.particle_effects.append({
                 'x': center_x,
                 'y': center_y,
-                'vx': speed * pygame.math.Vector2(1, 0).rotate(angle).x,
-                'vy': speed * pygame.math.Vector2(0, 1).rotate(angle).y,
+                'vx': speed * math.cos(angle),
+                'vy': speed * math.sin(angle),
                 'life': random.randint(30, 60),
                 'color': self.gold_color
             })
@@ -109,28 +150,30 @@ class LevelUpUI:
             return False
         
         if event.type == pygame.MOUSEMOTION:
-            mouse_pos = event.pos
-            
-            # Update button hover states
-            for attr, button_data in self.attribute_buttons.items():
-                button_data['hovered'] = button_data['rect'].collidepoint(mouse_pos)
-            
-            self.close_button['hovered'] = self.close_button['rect'].collidepoint(mouse_pos)
+            # Update button hover states (buttons never overlap, so at most
+            # one is hovered)
+            hit = pygame.Rect(event.pos, (1, 1)).collidelist(self._hover_rects)
+            if hit != self._hover_index:
+                if self._hover_index >= 0:
+                    self._hover_buttons[self._hover_index]['hovered'] = False
+                if hit >= 0:
+                    self._hover_buttons[hit]['hovered'] = True
+                self._hover_index = hit
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                mouse_pos = event.pos
+                hit = pygame.Rect(event.pos, (1, 1)).collidelist(self._hover_rects)
                 
                 # Check attribute buttons
-                for attr, button_data in self.attribute_buttons.items():
-                    if button_data['rect'].collidepoint(mouse_pos):
-                        if self.player_stats.add_attribute_point(attr):
-                            # Success sound would go here
-                            print(f"Added point to {attr}")
-                        return True
+                if 0 <= hit < len(self._attribute_keys):
+                    attr = self._attribute_keys[hit]
+                    if self.player_stats.add_attribute_point(attr):
+                        # Success sound would go here
+                        print(f"Added point to {attr}")
+                    return True
                 
                 # Check close button
-                if self.close_button['rect'].collidepoint(mouse_pos):
+                if hit == len(self._attribute_keys):
                     self.close()
                     return True
         
@@ -149,14 +192,30 @@ class LevelUpUI:
         self.animation_timer += 1
         
         # Update particles
-        for particle in self.particle_effects[:]:
+        for particle in self.particle_effects:
             particle['x'] += particle['vx']
             particle['y'] += particle['vy']
             particle['vy'] += 0.2  # Gravity
             particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.particle_effects.remove(particle)
+        
+        self.particle_effects = [p for p in self.particle_effects if p['life'] > 0]
+    
+    def _get_particle_surface(self, life, color):
+        """Get the (surface, radius) for a burst particle, drawing it on first use"""
+        key = (life, color)
+        cached = self._particle_surfaces.get(key)
+        if cached is None:
+            alpha = int(255 * (life / 60))
+            size = max(2, int(4 * (life / 60)))
+            particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(particle_surf, (*color, alpha), (size, size), size)
+            cached = (particle_surf, size)
+            self._particle_surfaces[key] = cached
+        return cached
+    
+    def _render_cached(self, font, text, color):
+        """Render text, reusing the surface from a previous identical render"""
+        return self._text_cache.render(font, text, color)
     
     def draw(self, screen):
         """Draw the level-up UI overlay"""
@@ -164,37 +223,75 @@ class LevelUpUI:
             return
         
         # Draw particles
+        particle_blits = []
         for particle in self.particle_effects:
-            alpha = int(255 * (particle['life'] / 60))
-            size = max(2, int(4 * (particle['life'] / 60)))
-            particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (*particle['color'], alpha), (size, size), size)
-            screen.blit(particle_surf, (int(particle['x']) - size, int(particle['y']) - size))
+            particle_surf, size = self._get_particle_surface(particle['life'], particle['color'])
+            particle_blits.append((particle_surf, (int(particle['x']) - size, int(particle['y']) - size)))
+        screen.blits(particle_blits, doreturn=False)
         
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
         
-        # Main panel
+        # Main panel (values and buttons redrawn only when they change)
+        state = self._get_panel_state()
+        if state != self._panel_state:
+            self._panel = self._static_panel.copy()
+            self._draw_panel_values(self._panel)
+            self._panel_state = state
+        
+        # Blit panel to screen
+        screen.blit(self._panel, (self.panel_x, self.panel_y))
+    
+    def _build_static_panel(self):
+        """Pre-draw the panel background, border, title and attribute labels"""
         panel_surf = pygame.Surface((self.panel_width, self.panel_height), pygame.SRCALPHA)
         panel_surf.fill(self.bg_color)
         pygame.draw.rect(panel_surf, self.border_color, (0, 0, self.panel_width, self.panel_height), 3)
         
         # Title
-        title_text = self.title_font.render("LEVEL UP!", True, self.gold_color)
+        title_text = self._render_cached(self.title_font, "LEVEL UP!", self.gold_color)
         title_rect = title_text.get_rect(centerx=self.panel_width // 2, top=20)
         panel_surf.blit(title_text, title_rect)
         
+        # Attributes
+        start_y = 180
+        spacing = 70
+        
+        for i, (name, attr_key, description) in enumerate(_ATTRIBUTES):
+            y_pos = start_y + (i * spacing)
+            
+            # Attribute name
+            attr_text = self._render_cached(self.stat_font, name, self.text_color)
+            panel_surf.blit(attr_text, (40, y_pos))
+            
+            # Description
+            desc_text = self._render_cached(self.small_font, description, (180, 180, 200))
+            panel_surf.blit(desc_text, (40, y_pos + 28))
+        
+        return panel_surf
+    
+    def _get_panel_state(self):
+        """Tuple that changes whenever _draw_panel_values would draw differently"""
+        stats = self.player_stats
+        return (
+            stats, stats.level, stats.attribute_points,
+            tuple(getattr(stats, attr_key) for attr_key in self.attribute_buttons),
+            tuple(button['hovered'] for button in self.attribute_buttons.values()),
+            self.close_button['hovered']
+        )
+    
+    def _draw_panel_values(self, panel_surf):
+        """Draw the level, points, attribute values and buttons onto the panel"""
         # Level display
-        level_text = self.header_font.render(f"Level {self.player_stats.level}", True, self.highlight_color)
+        level_text = self._render_cached(self.header_font, f"Level {self.player_stats.level}", self.highlight_color)
         level_rect = level_text.get_rect(centerx=self.panel_width // 2, top=70)
         panel_surf.blit(level_text, level_rect)
         
         # Available points
-        points_text = self.stat_font.render(
+        points_text = self._render_cached(
+            self.stat_font,
             f"Available Attribute Points: {self.player_stats.attribute_points}", 
-            True, self.gold_color if self.player_stats.attribute_points > 0 else self.text_color
+            self.gold_color if self.player_stats.attribute_points > 0 else self.text_color
         )
         points_rect = points_text.get_rect(centerx=self.panel_width // 2, top=120)
         panel_surf.blit(points_text, points_rect)
@@ -203,34 +300,16 @@ class LevelUpUI:
         start_y = 180
         spacing = 70
         
-        attributes = [
-            ('Strength', 'strength', f"Melee damage, HP, carry weight"),
-            ('Dexterity', 'dexterity', f"Attack speed, dodge, accuracy"),
-            ('Intelligence', 'intelligence', f"Magic damage, mana, resistances"),
-            ('Vitality', 'vitality', f"Max health, health regen, defense")
-        ]
-        
-        for i, (name, attr_key, description) in enumerate(attributes):
+        for i, (attr_key, button) in enumerate(self.attribute_buttons.items()):
             y_pos = start_y + (i * spacing)
             
-            # Attribute name
-            attr_text = self.stat_font.render(name, True, self.text_color)
-            panel_surf.blit(attr_text, (40, y_pos))
-            
             # Current value
             value = getattr(self.player_stats, attr_key)
-            value_text = self.header_font.render(str(value), True, self.highlight_color)
+            value_text = self._render_cached(self.header_font, str(value), self.highlight_color)
             panel_surf.blit(value_text, (250, y_pos - 5))
             
-            # Description
-            desc_text = self.small_font.render(description, True, (180, 180, 200))
-            panel_surf.blit(desc_text, (40, y_pos + 28))
-            
             # + Button (relative to panel)
-            button = self.attribute_buttons[attr_key]
-            button_rect_local = button['rect'].copy()
-            button_rect_local.x -= self.panel_x
-            button_rect_local.y -= self.panel_y
+            button_rect_local = button['local_rect']
             
             button_color = self.button_hover_color if button['hovered'] else self.button_color
             if self.player_stats.attribute_points <= 0:
@@ -239,22 +318,17 @@ class LevelUpUI:
             pygame.draw.rect(panel_surf, button_color, button_rect_local, border_radius=5)
             pygame.draw.rect(panel_surf, self.border_color, button_rect_local, 2, border_radius=5)
             
-            plus_text = self.header_font.render("+", True, self.text_color)
+            plus_text = self._render_cached(self.header_font, "+", self.text_color)
             plus_rect = plus_text.get_rect(center=button_rect_local.center)
             panel_surf.blit(plus_text, plus_rect)
         
         # Close button
-        close_rect_local = self.close_button['rect'].copy()
-        close_rect_local.x -= self.panel_x
-        close_rect_local.y -= self.panel_y
+        close_rect_local = self.close_button['local_rect']
         
         close_color = self.button_hover_color if self.close_button['hovered'] else self.button_color
         pygame.draw.rect(panel_surf, close_color, close_rect_local, border_radius=5)
         pygame.draw.rect(panel_surf, self.border_color, close_rect_local, 2, border_radius=5)
         
-        close_text = self.stat_font.render(self.close_button['text'], True, self.text_color)
+        close_text = self._render_cached(self.stat_font, self.close_button['text'], self.text_color)
         close_text_rect = close_text.get_rect(center=close_rect_local.center)
         panel_surf.blit(close_text, close_text_rect)
-        
-        # Blit panel to screen
-        screen.blit(panel_surf, (self.panel_x, self.panel_y))
@@ -6,6 +6,14 @@ Smooth scrolling camera with zoom support and parallax layers
 import pygame
 from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
 
+# Target offsets from the followed entity (player slightly left of and
+# above center, zoomed side-scroller framing)
+_TARGET_OFFSET_X = SCREEN_WIDTH // 2.5
+_TARGET_OFFSET_Y = SCREEN_HEIGHT // 2.2
+# Furthest the camera can scroll while staying inside the world
+_MAX_X = WORLD_WIDTH - SCREEN_WIDTH
+_MAX_Y = WORLD_HEIGHT - SCREEN_HEIGHT
+
 
 class Camera:
     """
@@ -27,6 +35,11 @@ class Camera:
         return pygame.Rect(entity.rect.x - self.x, entity.rect.y - self.y, 
                           entity.rect.width, entity.rect.height)
     
+    def apply_xy(self, entity):
+        """Apply camera offset to entity position, as an (x, y) blit position"""
+        rect = entity.rect
+        return (rect.x - self.x, rect.y - self.y)
+    
     def apply_pos(self, x, y):
         """Apply camera offset to raw position"""
         return (x - self.x, y - self.y)
@@ -41,13 +54,10 @@ class Camera:
         zoom_speed = 0.1
         self.zoom += (self.target_zoom - self.zoom) * zoom_speed
         
-        # Tighter deadzone for zoomed-in side-scroller feel
-        deadzone_x = SCREEN_WIDTH // 10
-        deadzone_y = SCREEN_HEIGHT // 8
-        
         # Calculate target camera position (zoomed closer, player slightly left of center)
-        target_x = target.rect.centerx - SCREEN_WIDTH // 2.5  # Player slightly left
-        target_y = target.rect.centery - SCREEN_HEIGHT // 2.2  # Slightly above center
+        center_x, center_y = target.rect.center
+        target_x = center_x - _TARGET_OFFSET_X
+        target_y = center_y - _TARGET_OFFSET_Y
         
         # Camera anticipation based on velocity (helps with fast movement)
         anticipation_factor = 50
@@ -56,14 +66,14 @@ class Camera:
         
         # Much smoother camera movement for cinematic feel
         smoothness = 0.08  # Slower = smoother
-        self.x += (target_x - self.x) * smoothness
-        self.y += (target_y - self.y) * smoothness
+        x = self.x + (target_x - self.x) * smoothness
+        y = self.y + (target_y - self.y) * smoothness
         
         # Keep camera within world bounds
-        self.x = max(0, min(self.x, WORLD_WIDTH - SCREEN_WIDTH))
-        self.y = max(0, min(self.y, WORLD_HEIGHT - SCREEN_HEIGHT))
+        self.x = x = max(0, min(x, _MAX_X))
+        self.y = y = max(0, min(y, _MAX_Y))
         
-        self.camera = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.camera.update(x, y, self.width, self.height)
 
 
 class ParallaxLayer:
@@ -3,60 +3,94 @@ Collectibles System
 Coins, essence orbs, and other collectible items
 """
 
+import math
+
 import pygame
 from src.core.constants import GLOW_CYAN, GLOW_BLUE, WHITE
 
+# Frames in one float cycle (0.8 degrees per frame)
+_FLOAT_PERIOD = 450
+# Vertical float offset for each frame of the cycle
+_FLOAT_OFFSETS = tuple(math.cos(math.radians(i * 0.8)) * 8 for i in range(_FLOAT_PERIOD))
+
 
 class Coin(pygame.sprite.Sprite):
     """
     Collectible essence/soul orb (Hollow Knight inspired)
     Glowing ethereal collectible
     """
+    # Frames in one pulse cycle (the glow peaks every 180 degrees at
+    # 1.5 degrees per frame)
+    _PULSE_PERIOD = 120
+    # Pre-drawn orb per pulse frame, shared by every coin
+    _PULSE_FRAMES = None
+    
     def __init__(self, x, y):
         super().__init__()
         self.base_y = y
         self.float_offset = 0
         self.pulse_offset = 0
-        self.create_orb()
+        if Coin._PULSE_FRAMES is None:
+            Coin._build_frames()
+        self.image = Coin._PULSE_FRAMES[0]
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.centery = y
         
-    def create_orb(self):
+    @classmethod
+    def _build_frames(cls):
+        """Draw the glowing orb once for every frame of the pulse cycle"""
+        frames = []
+        by_alpha = {}
+        for i in range(cls._PULSE_PERIOD):
+            pulse = abs(math.cos(math.radians(i * 1.5)))
+            alpha_mult = 0.7 + pulse * 0.3
+            alphas = (int(30 * alpha_mult), int(80 * alpha_mult), int(150 * alpha_mult))
+            
+            # Frames whose glow rounds to the same alphas share a surface
+            image = by_alpha.get(alphas)
+            if image is None:
+                image = cls._draw_orb(*alphas)
+                by_alpha[alphas] = image
+            frames.append(image)
+        cls._PULSE_FRAMES = tuple(frames)
+        
+    @staticmethod
+    def _draw_orb(outer_alpha, middle_alpha, core_alpha):
         """Create a glowing ethereal orb"""
-        self.image = pygame.Surface((28, 28), pygame.SRCALPHA)
+        image = pygame.Surface((28, 28), pygame.SRCALPHA)
         
         # Outer glow (largest, most transparent)
-        pygame.draw.circle(self.image, (*GLOW_CYAN[:3], 30), (14, 14), 13)
+        pygame.draw.circle(image, (*GLOW_CYAN[:3], outer_alpha), (14, 14), 13)
         
         # Middle glow
-        pygame.draw.circle(self.image, (*GLOW_CYAN[:3], 80), (14, 14), 9)
+        pygame.draw.circle(image, (*GLOW_CYAN[:3], middle_alpha), (14, 14), 9)
         
         # Inner bright core
-        pygame.draw.circle(self.image, (*GLOW_BLUE[:3], 150), (14, 14), 6)
+        pygame.draw.circle(image, (*GLOW_BLUE[:3], core_alpha), (14, 14), 6)
         
         # Bright center
-        pygame.draw.circle(self.image, (200, 240, 255), (14, 14), 3)
+        pygame.draw.circle(image, (200, 240, 255), (14, 14), 3)
         
         # Sparkle effect
-        pygame.draw.circle(self.image, WHITE, (16, 12), 1)
+        pygame.draw.circle(image, WHITE, (16, 12), 1)
+        return image
         
-    def update(self):
-        """Floating and pulsing animation"""
-        self.float_offset += 0.08
-        self.pulse_offset += 0.15
+    def update(self, camera_rect=None):
+        """
+        Floating and pulsing animation
+        
+        Args:
+            camera_rect: Visible world area; off-screen coins keep their
+                animation phase but skip moving and swapping frames
+        """
+        self.float_offset = (self.float_offset + 1) % _FLOAT_PERIOD
+        self.pulse_offset = (self.pulse_offset + 1) % Coin._PULSE_PERIOD
+        if camera_rect is not None and not camera_rect.colliderect(self.rect):
+            return
         
         # Float up and down
-        float_y = self.base_y + pygame.math.Vector2(0, 1).rotate(self.float_offset * 10).y * 8
-        self.rect.centery = float_y
-        
-        # Pulsing glow effect (recreate image with different alpha)
-        pulse = abs(pygame.math.Vector2(1, 0).rotate(self.pulse_offset * 10).x)
-        alpha_mult = 0.7 + pulse * 0.3
-        
-        self.image = pygame.Surface((28, 28), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (*GLOW_CYAN[:3], int(30 * alpha_mult)), (14, 14), 13)
-        pygame.draw.circle(self.image, (*GLOW_CYAN[:3], int(80 * alpha_mult)), (14, 14), 9)
-        pygame.draw.circle(self.image, (*GLOW_BLUE[:3], int(150 * alpha_mult)), (14, 14), 6)
-        pygame.draw.circle(self.image, (200, 240, 255), (14, 14), 3)
-        pygame.draw.circle(self.image, WHITE, (16, 12), 1)
+        self.rect.centery = self.base_y + _FLOAT_OFFSETS[self.float_offset]
+        
+        # Pulsing glow effect (swap to the pre-drawn frame)
+        self.image = Coin._PULSE_FRAMES[self.pulse_offset]
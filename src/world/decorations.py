@@ -11,6 +11,9 @@ class DecorativeElement(pygame.sprite.Sprite):
     """
     Environmental decoration (glowing crystals, roots, etc.)
     """
+    # Pre-drawn image per element_type, shared by every decoration of that type
+    _IMAGES = {}
+    
     def __init__(self, x, y, element_type='crystal'):
         super().__init__()
         self.element_type = element_type
@@ -21,22 +24,33 @@ class DecorativeElement(pygame.sprite.Sprite):
         self.rect.y = y
         
     def create_element(self):
+        """Pick up the shared image for this element type, drawing it on first use"""
+        image = DecorativeElement._IMAGES.get(self.element_type)
+        if image is None:
+            image = DecorativeElement._draw_element(self.element_type)
+            DecorativeElement._IMAGES[self.element_type] = image
+        self.image = image
+        
+    @staticmethod
+    def _draw_element(element_type):
         """Create decorative element"""
-        if self.element_type == 'crystal':
-            self.image = pygame.Surface((20, 30), pygame.SRCALPHA)
+        if element_type == 'crystal':
+            image = pygame.Surface((20, 30), pygame.SRCALPHA)
             # Crystal shape
             crystal_points = [(10, 0), (16, 10), (14, 28), (6, 28), (4, 10)]
-            pygame.draw.polygon(self.image, GLOW_CYAN, crystal_points)
-            pygame.draw.polygon(self.image, GLOW_BLUE, [(10, 2), (14, 10), (12, 25), (8, 25), (6, 10)])
+            pygame.draw.polygon(image, GLOW_CYAN, crystal_points)
+            pygame.draw.polygon(image, GLOW_BLUE, [(10, 2), (14, 10), (12, 25), (8, 25), (6, 10)])
             # Bright core
-            pygame.draw.line(self.image, WHITE, (10, 5), (10, 20), 2)
+            pygame.draw.line(image, WHITE, (10, 5), (10, 20), 2)
+            return image
             
-        elif self.element_type == 'grass':
-            self.image = pygame.Surface((8, 16), pygame.SRCALPHA)
+        elif element_type == 'grass':
+            image = pygame.Surface((8, 16), pygame.SRCALPHA)
             # Simple grass blade
-            pygame.draw.line(self.image, MOSS_LIGHT, (4, 16), (3, 8), 2)
-            pygame.draw.line(self.image, MOSS_LIGHT, (3, 8), (4, 0), 2)
-            pygame.draw.line(self.image, MOSS_GREEN, (4, 16), (4, 6), 1)
+            pygame.draw.line(image, MOSS_LIGHT, (4, 16), (3, 8), 2)
+            pygame.draw.line(image, MOSS_LIGHT, (3, 8), (4, 0), 2)
+            pygame.draw.line(image, MOSS_GREEN, (4, 16), (4, 6), 1)
+            return image
             
     def update(self):
         """Subtle animation for crystals"""
@@ -5,6 +5,76 @@ Visual effects for player actions and environmental feedback
 
 import pygame
 
+from src.core.resources import SurfaceCache, load_font
+
+
+# Pre-drawn particle images keyed by (type, rgb, size, alpha bucket),
+# shared by every particle
+_PARTICLE_CACHE = {}
+_PARTICLE_CACHE_MAX = 2048
+# Number of alpha steps a particle fades through over its lifetime
+_ALPHA_BUCKETS = 16
+
+
+def _get_particle_surface(particle_type, color3, size, alpha_bucket):
+    """
+    Get the image for a particle, drawing it on first use
+    
+    Args:
+        particle_type: 'dust', 'spark' or 'trail'
+        color3: RGB color tuple
+        size: Particle radius
+        alpha_bucket: Fade step, 0 (transparent) to _ALPHA_BUCKETS (opaque)
+        
+    Returns:
+        Particle surface (shared - do not modify)
+    """
+    key = (particle_type, color3, size, alpha_bucket)
+    image = _PARTICLE_CACHE.get(key)
+    if image is not None:
+        return image
+    
+    if len(_PARTICLE_CACHE) >= _PARTICLE_CACHE_MAX:
+        # Evict the oldest entry
+        del _PARTICLE_CACHE[next(iter(_PARTICLE_CACHE))]
+    
+    image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    color = (*color3, 255 * alpha_bucket // _ALPHA_BUCKETS)
+    
+    if particle_type == 'dust':
+        # Dust cloud particle
+        pygame.draw.circle(image, color, (size, size), size)
+    elif particle_type == 'spark':
+        # Sharp spark particle
+        points = [
+            (size, 0),
+            (size + size//2, size),
+            (size, size * 2),
+            (size - size//2, size)
+        ]
+        pygame.draw.polygon(image, color, points)
+    elif particle_type == 'trail':
+        # Dash trail particle
+        pygame.draw.ellipse(image, color, (0, size//2, size * 2, size))
+    
+    _PARTICLE_CACHE[key] = image
+    return image
+
+
+# Rendered damage number text keyed by (font, text, color), shared by
+# every damage number
+_DAMAGE_TEXT_CACHE = SurfaceCache(512)
+
+
+def _get_damage_text(text, font_size, color):
+    """
+    Get the rendered text for a damage number, rendering it on first use
+    
+    Returns:
+        Text surface (shared - do not modify)
+    """
+    return _DAMAGE_TEXT_CACHE.render(load_font(None, font_size), text, color)
+
 
 class Particle(pygame.sprite.Sprite):
     """
@@ -21,35 +91,37 @@ class Particle(pygame.sprite.Sprite):
         self.size = size
         self.particle_type = particle_type
         
-        self.image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        self._color3 = tuple(color[:3])
+        self._last_bucket = None
+        self.draw_particle()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
+        
+    def create_particle_surface(self):
+        """Re-pick the image after color, size or lifetime were reset (ParticlePool reuse)"""
+        self._color3 = tuple(self.color[:3])
+        self._last_bucket = None
         self.draw_particle()
         
     def draw_particle(self):
-        """Draw particle based on type"""
-        self.image.fill((0, 0, 0, 0))
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
+        """Pick the cached image for the current fade step"""
+        # Round up so the particle stays visible until it expires
+        alpha_bucket = -(-self.lifetime * _ALPHA_BUCKETS // self.max_lifetime)
+        if alpha_bucket == self._last_bucket:
+            return
+        self._last_bucket = alpha_bucket
+        self.image = _get_particle_surface(
+            self.particle_type, self._color3, self.size, alpha_bucket
+        )
         
-        if self.particle_type == 'dust':
-            # Dust cloud particle
-            pygame.draw.circle(self.image, (*self.color[:3], alpha), (self.size, self.size), self.size)
-        elif self.particle_type == 'spark':
-            # Sharp spark particle
-            points = [
-                (self.size, 0),
-                (self.size + self.size//2, self.size),
-                (self.size, self.size * 2),
-                (self.size - self.size//2, self.size)
-            ]
-            pygame.draw.polygon(self.image, (*self.color[:3], alpha), points)
-        elif self.particle_type == 'trail':
-            # Dash trail particle
-            pygame.draw.ellipse(self.image, (*self.color[:3], alpha), 
-                              (0, self.size//2, self.size * 2, self.size))
-        
-    def update(self):
-        """Update particle position and lifetime"""
+    def update(self, camera_rect=None):
+        """
+        Update particle position and lifetime
+        
+        Args:
+            camera_rect: Visible world area; off-screen particles still
+                move and expire but skip their fade
+        """
         self.rect.x += self.velocity_x
         self.rect.y += self.velocity_y
         
@@ -61,8 +133,67 @@ class Particle(pygame.sprite.Sprite):
         self.lifetime -= 1
         if self.lifetime <= 0:
             self.kill()
-        else:
+        elif camera_rect is None or camera_rect.colliderect(self.rect):
             self.draw_particle()
+    
+    @staticmethod
+    def draw_batch(screen, sprites, camera_x=0, camera_y=0):
+        """
+        Draw a group of particles (and damage numbers) in one blits call
+        
+        Args:
+            screen: Surface to draw on
+            sprites: Iterable of sprites with image and rect
+            camera_x: Camera world x offset
+            camera_y: Camera world y offset
+        """
+        # Same offset as Camera.apply_xy, so particles line up with the sprites
+        screen.blits(
+            [(sprite.image, (sprite.rect.x - camera_x, sprite.rect.y - camera_y))
+             for sprite in sprites],
+            doreturn=False
+        )
+
+
+class ParticleGroup(pygame.sprite.Group):
+    """
+    Sprite group for particles and damage numbers
+    
+    Steps every Particle in a single loop rather than calling each
+    particle's update(); any other sprite updates as usual.
+    """
+    def update(self, camera_rect=None):
+        """
+        Update every sprite in the group
+        
+        Args:
+            camera_rect: Visible world area; off-screen sprites still
+                move and expire but skip their fade
+        """
+        in_view = camera_rect.colliderect if camera_rect is not None else None
+        for sprite in self.sprites():
+            if type(sprite) is not Particle:
+                sprite.update(camera_rect)
+                continue
+            
+            # Same integration as Particle.update, inlined
+            rect = sprite.rect
+            rect.x += sprite.velocity_x
+            rect.y += sprite.velocity_y
+            if sprite.particle_type == 'dust':
+                sprite.velocity_y += 0.15
+            
+            lifetime = sprite.lifetime = sprite.lifetime - 1
+            if lifetime <= 0:
+                sprite.kill()
+                continue
+            if in_view is not None and not in_view(rect):
+                continue
+            
+            # Only call into draw_particle when the fade step changes
+            alpha_bucket = -(-lifetime * _ALPHA_BUCKETS // sprite.max_lifetime)
+            if alpha_bucket != sprite._last_bucket:
+                sprite.draw_particle()
 
 
 class DamageNumber(pygame.sprite.Sprite):
@@ -77,7 +208,6 @@ class DamageNumber(pygame.sprite.Sprite):
         
         # Font
         font_size = 24 if is_crit else 18
-        self.font = pygame.font.Font(None, font_size)
         
         # Position
         self.x = x
@@ -87,29 +217,35 @@ class DamageNumber(pygame.sprite.Sprite):
         # Color based on crit
         self.color = (255, 200, 50) if is_crit else (255, 255, 255)
         
-        # Create text surface
+        # Text never changes, so take a private copy of the shared render
+        # once and only fade it per frame
+        text = str(int(self.damage))
+        if self.is_crit:
+            text = f"{text}!"
+        self.image = _get_damage_text(text, font_size, self.color).copy()
         self.update_image()
     
     def update_image(self):
         """Update the damage number display"""
-        text = str(int(self.damage))
-        if self.is_crit:
-            text = f"{text}!"
-        
         # Fade out over time
         alpha = int(255 * (1 - self.age / self.lifetime))
         
-        self.image = self.font.render(text, True, self.color)
         self.image.set_alpha(alpha)
         self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
     
-    def update(self):
-        """Update damage number position and lifetime"""
+    def update(self, camera_rect=None):
+        """
+        Update damage number position and lifetime
+        
+        Args:
+            camera_rect: Visible world area; off-screen numbers still
+                move and expire but skip their fade
+        """
         self.age += 1
         self.y += self.velocity_y
         self.velocity_y *= 0.95  # Slow down
         
         if self.age >= self.lifetime:
             self.kill()
-        else:
+        elif camera_rect is None or camera_rect.colliderect(self.rect):
             self.update_image()
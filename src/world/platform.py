@@ -16,108 +16,238 @@ class Platform(pygame.sprite.Sprite):
     Detailed platform with Hollow Knight aesthetic
     Stone platforms with moss, cracks, and depth
     """
+    # Pre-drawn image per (width, height, platform_type), shared by every
+    # platform of that shape. Platform.image is never drawn on after
+    # construction - copy it before modifying.
+    _IMAGES = {}
+    # Pre-drawn moss segments keyed by (segment width, has clump)
+    _MOSS_TILES = {}
+    # Pre-drawn 40px wall sections keyed by width
+    _WALL_STRIPES = {}
+    # Pre-drawn weathering spots keyed by radius
+    _SPOT_STAMPS = {}
+    
     def __init__(self, x, y, width, height, platform_type='stone'):
         super().__init__()
         self.width = width
         self.height = height
         self.platform_type = platform_type
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        key = (width, height, platform_type)
+        image = Platform._IMAGES.get(key)
+        if image is None:
+            # Every platform style covers its whole rect, so no alpha channel
+            self.image = pygame.Surface((width, height))
+            self.draw_detailed_platform()
+            # Match the display's pixel format once so blits skip conversion
+            if pygame.display.get_surface() is not None:
+                self.image = self.image.convert()
+            image = self.image
+            Platform._IMAGES[key] = image
+        self.image = image
+        
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
-        self.draw_detailed_platform()
+    
+    @staticmethod
+    def draw_visible(screen, platforms, camera):
+        """
+        Draw the platforms that overlap the camera view in one blits call
+        
+        Args:
+            screen: Surface to draw on
+            platforms: Iterable of Platforms
+            camera: Camera providing the view rect and world offset
+        """
+        # One pixel of slack each side covers the camera's fractional offset
+        view = camera.camera.inflate(2, 2)
+        apply_xy = camera.apply_xy
+        screen.blits(
+            [(platform.image, apply_xy(platform))
+             for platform in platforms if view.colliderect(platform.rect)],
+            doreturn=False
+        )
+    
+    @classmethod
+    def _get_moss_tile(cls, moss_w, clump):
+        """
+        Get one pre-drawn moss segment, drawing it on first use
+        
+        The tile's top-left sits at (moss_x, -2) on the platform. Every
+        pixel is either fully opaque or fully transparent, so blitting it
+        gives the same result as drawing the ellipses in place.
+        """
+        key = (moss_w, clump)
+        tile = cls._MOSS_TILES.get(key)
+        if tile is None:
+            tile = pygame.Surface((moss_w, 8), pygame.SRCALPHA)
+            # Layered moss for depth
+            pygame.draw.ellipse(tile, MOSS_GREEN, (0, 0, moss_w, 8))
+            pygame.draw.ellipse(tile, MOSS_LIGHT, (2, 2, moss_w - 4, 5))
+            pygame.draw.ellipse(tile, (100, 140, 110), (4, 3, moss_w - 8, 3))
+            # Small moss clump
+            if clump:
+                pygame.draw.circle(tile, MOSS_GREEN, (moss_w//2, 4), 3)
+            cls._MOSS_TILES[key] = tile
+        return tile
+    
+    @classmethod
+    def _get_wall_stripe(cls, width):
+        """
+        Get one pre-drawn 40px section of wall, drawing it on first use
+        
+        Row 10 holds the horizontal detail line; every other row is the
+        same plain wall row.
+        """
+        stripe = cls._WALL_STRIPES.get(width)
+        if stripe is None:
+            stripe = pygame.Surface((width, 40))
+            stripe.fill(STONE_MID)
+            
+            # Side highlights
+            stripe.fill(STONE_LIGHT, (0, 0, 3, 40))
+            stripe.fill(STONE_DARK, (width - 3, 0, 3, 40))
+            
+            # Horizontal detail line
+            stripe.fill(STONE_DARK, (0, 10, width, 1))
+            cls._WALL_STRIPES[width] = stripe
+        return stripe
+    
+    @classmethod
+    def _get_spot_stamp(cls, spot_size):
+        """
+        Get one pre-drawn weathering spot, drawing it on first use
+        
+        The spot's center sits at (spot_size + 1, spot_size + 1) in the
+        stamp. Pixels are fully opaque or fully transparent.
+        """
+        stamp = cls._SPOT_STAMPS.get(spot_size)
+        if stamp is None:
+            center = spot_size + 1
+            stamp = pygame.Surface((center * 2 + 1, center * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (35, 38, 52), (center, center), spot_size)
+            if spot_size > 1:
+                pygame.draw.circle(stamp, (42, 46, 60), (center - 1, center - 1), spot_size - 1)
+            cls._SPOT_STAMPS[spot_size] = stamp
+        return stamp
     
     def draw_detailed_platform(self):
         """Draw platform with enhanced detail and depth"""
+        width, height, image = self.width, self.height, self.image
+        
         if self.platform_type == 'stone':
-            # Base foundation (darkest layer)
-            pygame.draw.rect(self.image, STONE_DARK, (0, 0, self.width, self.height))
-            
             # Stone stratification layers
-            layer1_h = max(3, self.height // 5)
-            layer2_h = max(5, self.height // 3)
-            layer3_h = max(4, self.height // 4)
+            layer1_h = max(3, height // 5)
+            layer2_h = max(5, height // 3)
+            # Third band is clipped to whatever height is left on short platforms
+            layer3_h = max(0, min(max(4, height // 4), height - layer1_h - layer2_h))
             
-            pygame.draw.rect(self.image, STONE_LIGHT, (0, 0, self.width, layer1_h))
-            pygame.draw.rect(self.image, STONE_MID, (0, layer1_h, self.width, layer2_h))
-            if layer1_h + layer2_h + layer3_h <= self.height:
-                pygame.draw.rect(self.image, (38, 42, 58), (0, layer1_h + layer2_h, self.width, layer3_h))
+            # Solid bands are plain fills (base foundation is the darkest layer)
+            image.fill(STONE_DARK)
+            image.fill(STONE_LIGHT, (0, 0, width, layer1_h))
+            image.fill(STONE_MID, (0, layer1_h, width, layer2_h))
+            image.fill((38, 42, 58), (0, layer1_h + layer2_h, width, layer3_h))
             
             # Detailed moss growth on top
-            if self.width > 30:
-                moss_segments = max(3, self.width // 35)
-                for i in range(moss_segments):
-                    moss_x = (self.width // moss_segments) * i - 2
-                    moss_w = (self.width // moss_segments) + 8
-                    # Layered moss for depth
-                    pygame.draw.ellipse(self.image, MOSS_GREEN, (moss_x, -2, moss_w, 8))
-                    pygame.draw.ellipse(self.image, MOSS_LIGHT, (moss_x + 2, 0, moss_w - 4, 5))
-                    pygame.draw.ellipse(self.image, (100, 140, 110), (moss_x + 4, 1, moss_w - 8, 3))
-                    # Small moss clumps
-                    if i % 2 == 0 and moss_w > 15:
-                        pygame.draw.circle(self.image, MOSS_GREEN, (moss_x + moss_w//2, 2), 3)
+            if width > 30:
+                moss_segments = max(3, width // 35)
+                moss_step = width // moss_segments
+                moss_w = moss_step + 8
+                # Every segment is the same size; small clumps on even segments
+                plain_tile = Platform._get_moss_tile(moss_w, False)
+                clump_tile = Platform._get_moss_tile(moss_w, True) if moss_w > 15 else plain_tile
+                image.blits(
+                    [(clump_tile if i % 2 == 0 else plain_tile, (moss_step * i - 2, -2))
+                     for i in range(moss_segments)],
+                    doreturn=False
+                )
             
             # Intricate crack patterns
-            if self.width > 40 and self.height > 10:
-                random.seed(self.rect.x + self.rect.y)
+            if width > 40 and height > 10:
+                # Local RNG seeded by shape, so same-shape platforms share an
+                # image and the global random state is left alone
+                rng = random.Random(f"{self.platform_type}:{width}x{height}")
+                randint = rng.randint
+                
+                # Crack runs are collected first and drawn in one pass per
+                # color; horizontal and vertical runs are 1px-wide fills
+                crack_rects = []
+                shadow_rects = []
+                branch_lines = []
                 
                 # Major horizontal cracks
-                num_h_cracks = max(1, self.height // 25)
+                num_h_cracks = max(1, height // 25)
                 for i in range(num_h_cracks):
-                    crack_y = 8 + i * (self.height // num_h_cracks)
-                    crack_start = random.randint(2, 10)
-                    crack_end = self.width - random.randint(2, 10)
-                    pygame.draw.line(self.image, STONE_DARK, (crack_start, crack_y), (crack_end, crack_y), 1)
+                    crack_y = 8 + i * (height // num_h_cracks)
+                    crack_start = randint(2, 10)
+                    crack_end = width - randint(2, 10)
+                    crack_rects.append((crack_start, crack_y, crack_end - crack_start + 1, 1))
                     # Crack depth shadow
-                    if crack_y + 1 < self.height:
-                        pygame.draw.line(self.image, (20, 22, 32), (crack_start, crack_y + 1), (crack_end, crack_y + 1), 1)
+                    if crack_y + 1 < height:
+                        shadow_rects.append((crack_start, crack_y + 1, crack_end - crack_start + 1, 1))
                 
                 # Vertical stress cracks
-                if self.width > 80:
-                    num_v_cracks = self.width // 90
+                if width > 80:
+                    num_v_cracks = width // 90
                     for i in range(num_v_cracks):
-                        crack_x = 30 + i * 90 + random.randint(-10, 10)
-                        crack_top = random.randint(4, 8)
-                        crack_bottom = self.height - random.randint(2, 6)
-                        pygame.draw.line(self.image, STONE_DARK, (crack_x, crack_top), (crack_x, crack_bottom), 1)
+                        crack_x = 30 + i * 90 + randint(-10, 10)
+                        crack_top = randint(4, 8)
+                        crack_bottom = height - randint(2, 6)
+                        crack_rects.append((crack_x, min(crack_top, crack_bottom), 
+                                            1, abs(crack_bottom - crack_top) + 1))
                         # Branching mini-crack
                         branch_y = crack_top + (crack_bottom - crack_top) // 2
-                        branch_len = random.randint(5, 12)
-                        if crack_x + branch_len < self.width:
-                            pygame.draw.line(self.image, STONE_DARK, (crack_x, branch_y), 
-                                           (crack_x + branch_len, branch_y + random.randint(-3, 3)), 1)
+                        branch_len = randint(5, 12)
+                        if crack_x + branch_len < width:
+                            branch_lines.append(((crack_x, branch_y), 
+                                                 (crack_x + branch_len, branch_y + randint(-3, 3))))
+                
+                # Shadows first so crossing vertical cracks stay dark
+                for rect in shadow_rects:
+                    image.fill((20, 22, 32), rect)
+                for rect in crack_rects:
+                    image.fill(STONE_DARK, rect)
+                for start, end in branch_lines:
+                    pygame.draw.line(image, STONE_DARK, start, end, 1)
                 
                 # Rock texture spots (weathering)
-                num_spots = self.width // 40
+                num_spots = width // 40
+                spot_x_max = width - 10
+                spot_y_min = max(6, height // 4)
+                spot_y_max = height - 4
+                spot_blits = []
                 for i in range(num_spots):
-                    spot_x = random.randint(5, self.width - 10)
-                    spot_y = random.randint(max(6, self.height // 4), self.height - 4)
-                    spot_size = random.randint(2, 5)
-                    pygame.draw.circle(self.image, (35, 38, 52), (spot_x, spot_y), spot_size)
-                    if spot_size > 1:
-                        pygame.draw.circle(self.image, (42, 46, 60), (spot_x - 1, spot_y - 1), spot_size - 1)
+                    spot_x = randint(5, spot_x_max)
+                    spot_y = randint(spot_y_min, spot_y_max)
+                    spot_size = randint(2, 5)
+                    spot_blits.append((Platform._get_spot_stamp(spot_size), 
+                                       (spot_x - spot_size - 1, spot_y - spot_size - 1)))
+                image.blits(spot_blits, doreturn=False)
             
-            # Enhanced edge definition
-            pygame.draw.line(self.image, STONE_LIGHT, (0, 0), (self.width, 0), 3)  # Top highlight
-            pygame.draw.line(self.image, (85, 95, 115), (0, 1), (self.width, 1), 1)  # Sub-highlight
-            if self.height >= 2:
-                pygame.draw.line(self.image, STONE_DARK, (0, self.height - 2), (self.width, self.height - 2), 2)
-            pygame.draw.line(self.image, (20, 22, 32), (0, self.height - 1), (self.width, self.height - 1), 1)
+            # Enhanced edge definition (edge bands are plain fills)
+            image.fill(STONE_LIGHT, (0, 0, width, 2))  # Top highlight
+            image.fill((85, 95, 115), (0, 1, width, 1))  # Sub-highlight
+            if height >= 2:
+                image.fill(STONE_DARK, (0, height - 2, width, 2))
+            image.fill((20, 22, 32), (0, height - 1, width, 1))
             
             # Side edges for 3D effect
-            if self.height > 15:
-                pygame.draw.line(self.image, (48, 52, 68), (0, 2), (0, self.height - 3), 1)
-                pygame.draw.line(self.image, STONE_DARK, (self.width - 1, 2), (self.width - 1, self.height - 3), 1)
+            if height > 15:
+                image.fill((48, 52, 68), (0, 2, 1, height - 4))
+                image.fill(STONE_DARK, (width - 1, 2, 1, height - 4))
             
         elif self.platform_type == 'wall':
-            # Vertical wall style
-            pygame.draw.rect(self.image, STONE_MID, (0, 0, self.width, self.height))
-            
-            # Side highlights
-            pygame.draw.rect(self.image, STONE_LIGHT, (0, 0, 3, self.height))
-            pygame.draw.rect(self.image, STONE_DARK, (self.width - 3, 0, 3, self.height))
+            # Vertical wall style, tiled from 40px sections
+            stripe = Platform._get_wall_stripe(width)
+            full_stripes = height // 40
+            wall_blits = [(stripe, (0, i * 40)) for i in range(full_stripes)]
             
-            # Horizontal detail lines
-            for i in range(self.height // 40):
-                y = i * 40 + 10
-                pygame.draw.line(self.image, STONE_DARK, (0, y), (self.width, y), 1)
+            # The remainder below the last full section has no detail line
+            tail_y = full_stripes * 40
+            tail_h = height - tail_y
+            if tail_h > 0:
+                wall_blits.append((stripe, (0, tail_y), (0, 0, width, min(tail_h, 10))))
+            if tail_h > 10:
+                wall_blits.append((stripe, (0, tail_y + 10), (0, 11, width, tail_h - 10)))
+            image.blits(wall_blits, doreturn=False)